@@ -9,25 +9,76 @@ which exchanges client credentials for a JWT token that must be included
 in subsequent API requests.
 """
 
+import base64
+import binascii
 import json
-import jwt
 import aiohttp
 import asyncio
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
-# Centralized import handling
 try:
-    from ..utils.imports import import_from
-    imports = import_from("..exceptions", "exceptions", "AuthenticationError")
-    pool_imports = import_from("..utils.connection_pool", "utils.connection_pool", "get_connection_pool")
-    AuthenticationError = imports['AuthenticationError']
-    get_connection_pool = pool_imports['get_connection_pool']
+    from ..exceptions import AuthenticationError
+    from ..utils.connection_pool import get_connection_pool
 except ImportError:
     # Fallback for direct execution
     from exceptions import AuthenticationError
     from utils.connection_pool import get_connection_pool
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Refresh tokens this many seconds before they actually expire
+TOKEN_EXPIRY_BUFFER_SECONDS = 300.0
+# Assumed lifetime when a token's exp claim cannot be read
+FALLBACK_TOKEN_LIFETIME_SECONDS = 3600.0
+_AUTH_HEADERS = {"Content-Type": "application/json"}
+# Known authenticate endpoint failures and their user-facing messages
+_AUTH_STATUS_ERRORS = {
+    400: "Bad request: Wrong request syntax",
+    401: "Unauthorized: Invalid Xray license or credentials",
+    500: "Internal server error during authentication",
+}
+
+
+def _extract_exp(token: str) -> Optional[float]:
+    """Return the ``exp`` claim of a JWT, or None if it cannot be read.
+
+    Only the payload segment is base64url-decoded and parsed; the header
+    and signature are ignored since we don't have the signing key and only
+    need the expiry.
+
+    Args:
+        token (str): Raw JWT as returned by the authenticate endpoint
+
+    Returns:
+        Optional[float]: Expiry as a POSIX timestamp, None if the token is
+            malformed or has no numeric ``exp`` claim
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1]
+    try:
+        claims = _json_loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except (ValueError, binascii.Error):
+        # Bad base64, non-UTF-8 bytes or invalid JSON
+        return None
+    if not isinstance(claims, dict):
+        return None
+    exp = claims.get("exp")
+    if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+        return None
+    return float(exp)
+
 
 class XrayAuthManager:
     """Manages JWT authentication with Xray API.
@@ -77,13 +128,30 @@ class XrayAuthManager:
         self.client_id = client_id
         self.client_secret = client_secret
         self.base_url = base_url
+        # Credentials and endpoint never change for a manager, so the request
+        # body is serialized once instead of on every token refresh
+        self._auth_url = f"{base_url}/api/v2/authenticate"
+        self._auth_body = json.dumps(
+            {"client_id": client_id, "client_secret": client_secret}
+        ).encode("utf-8")
         self.token: Optional[str] = None
-        self.token_expiry: Optional[datetime] = None
-        self._token_lock = (
-            asyncio.Lock()
-        )  # Prevents race conditions during token refresh
+        # Expiry as a POSIX timestamp; token_expiry exposes it as a datetime
+        self._token_expiry_ts: Optional[float] = None
+        # In-flight refresh shared by every caller that needs a new token
+        self._refresh_task: Optional["asyncio.Task[str]"] = None
         self._pool_manager = None
 
+    @property
+    def token_expiry(self) -> Optional[datetime]:
+        """Token expiration time in UTC, None if not authenticated."""
+        if self._token_expiry_ts is None:
+            return None
+        return datetime.fromtimestamp(self._token_expiry_ts, tz=timezone.utc)
+
+    @token_expiry.setter
+    def token_expiry(self, value: Optional[datetime]) -> None:
+        self._token_expiry_ts = None if value is None else value.timestamp()
+
     async def _get_pool_manager(self):
         """Get connection pool manager, initializing if needed."""
         if self._pool_manager is None:
@@ -119,60 +187,48 @@ class XrayAuthManager:
             The token is returned as a quoted JSON string by Xray API,
             so quotes are stripped before storage.
         """
-        auth_url = f"{self.base_url}/api/v2/authenticate"
-
-        payload = {"client_id": self.client_id, "client_secret": self.client_secret}
-
         try:
-            # Use connection pool for improved performance
-            pool_manager = await self._get_pool_manager()
+            # Use connection pool for improved performance (cached after first use)
+            pool_manager = self._pool_manager or await self._get_pool_manager()
             async with pool_manager.session_context() as session:
                 async with session.post(
-                    auth_url, json=payload, headers={"Content-Type": "application/json"}
+                    self._auth_url, data=self._auth_body, headers=_AUTH_HEADERS
                 ) as response:
                     if response.status == 200:
                         # Xray returns the token as a JSON string with quotes
-                        token_response = await response.text()
-                        # Strip the surrounding quotes from the token
-                        self.token = token_response.strip('"')
-
-                        # Extract expiry time from JWT claims without verifying signature
-                        # We don't have the signing key, so verification is not possible
+                        raw = await response.read()
+                        # Strip the surrounding quotes; JWTs are ASCII by construction
+                        if raw[:1] == b'"' and raw[-1:] == b'"':
+                            raw = raw[1:-1]
                         try:
-                            decoded = jwt.decode(
-                                self.token, options={"verify_signature": False}
+                            self.token = raw.decode("ascii")
+                        except UnicodeDecodeError:
+                            raise AuthenticationError(
+                                "Authentication response did not contain a valid token"
                             )
-                            if "exp" in decoded:
-                                self.token_expiry = datetime.fromtimestamp(
-                                    decoded["exp"], tz=timezone.utc
-                                )
-                        except jwt.InvalidTokenError:
+
+                        # Extract expiry time from JWT claims without verifying signature
+                        exp = _extract_exp(self.token)
+                        if exp is not None:
+                            self._token_expiry_ts = exp
+                        else:
                             # Fallback: If token decode fails, assume 1-hour validity
                             # This is a conservative estimate for Xray tokens
-                            from datetime import timedelta
-
-                            self.token_expiry = datetime.now(timezone.utc) + timedelta(
-                                hours=1
+                            self._token_expiry_ts = (
+                                time.time() + FALLBACK_TOKEN_LIFETIME_SECONDS
                             )
 
                         return self.token
+
                     # Handle specific error responses with meaningful messages
-                    elif response.status == 400:
-                        raise AuthenticationError("Bad request: Wrong request syntax")
-                    elif response.status == 401:
-                        raise AuthenticationError(
-                            "Unauthorized: Invalid Xray license or credentials"
-                        )
-                    elif response.status == 500:
-                        raise AuthenticationError(
-                            "Internal server error during authentication"
-                        )
-                    else:
-                        # Catch-all for unexpected status codes
-                        error_text = await response.text()
-                        raise AuthenticationError(
-                            f"Authentication failed with status {response.status}: {error_text}"
-                        )
+                    message = _AUTH_STATUS_ERRORS.get(response.status)
+                    if message is not None:
+                        raise AuthenticationError(message)
+                    # Catch-all for unexpected status codes
+                    error_text = await response.text()
+                    raise AuthenticationError(
+                        f"Authentication failed with status {response.status}: {error_text}"
+                    )
 
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             # Network-level errors (connection refused, timeout, DNS failure)
@@ -186,9 +242,13 @@ class XrayAuthManager:
         refreshing it if needed. This ensures API calls always have a
         valid token without manual token management.
 
-        The method uses an async lock to prevent race conditions where
-        multiple concurrent calls could trigger multiple authentication
-        requests, which could lead to rate limiting or unnecessary API calls.
+        A still-valid token is returned immediately. When a refresh is
+        needed, the first caller starts it as a task and every other caller
+        awaits that same task, so concurrent calls can't trigger multiple
+        authentication requests, which could lead to rate limiting or
+        unnecessary API calls. All waiters wake together when it finishes,
+        and a failed refresh raises in each of them without being retried
+        once per waiter.
 
         Returns:
             str: Valid JWT token ready for API use
@@ -199,22 +259,36 @@ class XrayAuthManager:
         Complexity: O(1) - Returns cached token or single auth request
 
         Call Flow:
-            1. Acquire async lock to prevent concurrent auth attempts
-            2. Check if token exists and is not expired
-            3. If invalid/expired, call authenticate()
-            4. Return the valid token
+            1. Return the token immediately if it exists and is not expired
+            2. Otherwise join the in-flight refresh, starting one if needed
+            3. Return the refreshed token
 
         Example:
             # Always use this method instead of accessing token directly
             token = await auth_manager.get_valid_token()
             headers = {"Authorization": f"Bearer {token}"}
         """
-        async with self._token_lock:
-            if self.token is None or self._is_token_expired():
-                await self.authenticate()
-
+        # Fast path: concurrent callers don't wait on each other in steady state
+        if self.token is not None and not self._is_token_expired():
             return self.token
 
+        task = self._refresh_task
+        if task is None:
+            task = asyncio.ensure_future(self.authenticate())
+            self._refresh_task = task
+            task.add_done_callback(self._on_refresh_done)
+        # Shield so one cancelled caller doesn't cancel the shared refresh
+        await asyncio.shield(task)
+        return self.token
+
+    def _on_refresh_done(self, task: "asyncio.Task[str]") -> None:
+        """Clear the finished refresh so the next expiry starts a new one."""
+        if self._refresh_task is task:
+            self._refresh_task = None
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled
+            task.exception()
+
     def _is_token_expired(self) -> bool:
         """Check if the current token is expired or near expiry.
 
@@ -226,7 +300,7 @@ class XrayAuthManager:
             bool: True if token is expired or will expire within 5 minutes,
                   False if token is valid for at least 5 more minutes
 
-        Complexity: O(1) - Simple datetime comparison
+        Complexity: O(1) - Single float comparison
 
         Note:
             The 5-minute buffer is a conservative approach to handle:
@@ -234,12 +308,9 @@ class XrayAuthManager:
             - Long-running API operations
             - Network latency
         """
-        if self.token_expiry is None:
+        if self._token_expiry_ts is None:
             return True
 
         # Check if token expires within the next 5 minutes
         # This buffer prevents auth failures during long operations
-        from datetime import timedelta
-
-        buffer_time = datetime.now(timezone.utc) + timedelta(minutes=5)
-        return self.token_expiry <= buffer_time
+        return self._token_expiry_ts <= time.time() + TOKEN_EXPIRY_BUFFER_SECONDS
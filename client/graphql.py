@@ -11,23 +11,15 @@ auth_manager and handles both GraphQL-level and HTTP-level errors appropriately.
 import json
 import asyncio
 import aiohttp
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 
-# Centralized import handling
 try:
-    from ..utils.imports import import_from
-    auth_imports = import_from("..auth", "auth", "XrayAuthManager")
-    exception_imports = import_from("..exceptions", "exceptions", "GraphQLError")
-    validator_imports = import_from("..validators.graphql_validator", "validators.graphql_validator", "GraphQLValidator")
-    security_imports = import_from("..security.response_limiter", "security.response_limiter", "get_response_limiter", "ResponseSizeLimitError")
-    pool_imports = import_from("..utils.connection_pool", "utils.connection_pool", "get_connection_pool")
-    
-    XrayAuthManager = auth_imports['XrayAuthManager']
-    GraphQLError = exception_imports['GraphQLError']
-    GraphQLValidator = validator_imports['GraphQLValidator']
-    get_response_limiter = security_imports['get_response_limiter']
-    ResponseSizeLimitError = security_imports['ResponseSizeLimitError']
-    get_connection_pool = pool_imports['get_connection_pool']
+    from ..auth import XrayAuthManager
+    from ..exceptions import GraphQLError
+    from ..validators.graphql_validator import GraphQLValidator
+    from ..security.response_limiter import get_response_limiter, ResponseSizeLimitError
+    from ..utils.connection_pool import get_connection_pool
 except ImportError:
     # Fallback for direct execution
     from auth import XrayAuthManager
@@ -36,6 +28,20 @@ except ImportError:
     from security.response_limiter import get_response_limiter, ResponseSizeLimitError
     from utils.connection_pool import get_connection_pool
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Number of variable-free query bodies kept pre-serialized per client
+_QUERY_BODY_CACHE_SIZE = 256
+
+# Bytes of a malformed response body quoted in the resulting error
+_ERROR_EXCERPT_BYTES = 500
+
 
 class XrayGraphQLClient:
     """GraphQL client for interacting with Xray API.
@@ -87,6 +93,11 @@ class XrayGraphQLClient:
         self.validator = GraphQLValidator()
         self.response_limiter = get_response_limiter()
         self._pool_manager = None
+        # Request headers for the current token; rebuilt only when it changes
+        self._headers_token: Optional[str] = None
+        self._headers: Dict[str, str] = {}
+        # Serialized request bodies for queries sent without variables
+        self._query_bodies: "OrderedDict[str, bytes]" = OrderedDict()
     
     async def _get_pool_manager(self):
         """Get connection pool manager, initializing if needed."""
@@ -151,44 +162,128 @@ class XrayGraphQLClient:
             result = await client.execute_query(query, {"id": "TEST-123"})
         """
         # Validate query for security before execution
+        validated_query = self._validate(query, variables)
+
+        # Get a fresh or cached valid token
+        token = await self.auth_manager.get_valid_token()
+
+        return await self._execute_with_token(token, validated_query, variables)
+
+    async def execute_many(
+        self,
+        queries: List[Tuple[str, Optional[Dict[str, Any]]]],
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Execute several GraphQL queries concurrently with one token lookup.
+
+        Every query is validated up front, a single token is fetched for the
+        whole batch, and the requests are then sent over the shared
+        connection pool, at most max_concurrency at a time.
+
+        Args:
+            queries (List[Tuple[str, Optional[Dict[str, Any]]]]): Pairs of
+                (query, variables), as would be passed to execute_query
+            max_concurrency (int): Most requests in flight at once. Keeps
+                large batches within the rate limit and the pool size, so
+                queued requests don't run into the request timeout.
+
+        Returns:
+            List[Dict[str, Any]]: GraphQL responses in the same order as
+                the input queries
+
+        Raises:
+            GraphQLError: If any query fails validation (before anything is
+                sent) or any request fails (same conditions as execute_query)
+
+        Example:
+            results = await client.execute_many([
+                (test_query, {"id": "1001"}),
+                (test_query, {"id": "1002"}),
+            ])
+        """
+        validated = [
+            (self._validate(query, variables), variables)
+            for query, variables in queries
+        ]
+        if not validated:
+            return []
+
+        token = await self.auth_manager.get_valid_token()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def execute(
+            query: str, variables: Optional[Dict[str, Any]]
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._execute_with_token(token, query, variables)
+
+        return list(
+            await asyncio.gather(
+                *(execute(query, variables) for query, variables in validated)
+            )
+        )
+
+    def _validate(self, query: str, variables: Optional[Dict[str, Any]]) -> str:
+        """Validate a query, wrapping validator failures in GraphQLError."""
         try:
-            validated_query = self.validator.validate_query(query, variables)
+            return self.validator.validate_query(query, variables)
         except Exception as e:
             raise GraphQLError(f"GraphQL query validation failed: {str(e)}")
-        
-        # Get a fresh or cached valid token
-        token = await self.auth_manager.get_valid_token()
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
+    async def _execute_with_token(
+        self,
+        token: str,
+        validated_query: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send an already-validated query using the given token.
+
+        Args:
+            token (str): Valid JWT token for the Authorization header
+            validated_query (str): Query returned by the validator
+            variables (Optional[Dict[str, Any]]): Optional query variables
 
-        # Construct GraphQL request payload using validated query
-        payload = {"query": validated_query}
+        Returns:
+            Dict[str, Any]: GraphQL response
+
+        Raises:
+            GraphQLError: On HTTP, GraphQL, size-limit or network errors
+        """
+        # Tokens live for about an hour, so reuse the headers built for it
+        if token != self._headers_token:
+            self._headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            }
+            self._headers_token = token
+        headers = self._headers
+
+        # Construct GraphQL request body using validated query
         if variables:
-            payload["variables"] = variables
+            body = _dumps({"query": validated_query, "variables": variables})
+        else:
+            body = self._query_body(validated_query)
 
         try:
-            # Use connection pool for improved performance
-            pool_manager = await self._get_pool_manager()
+            # Use connection pool for improved performance (cached after first use)
+            pool_manager = self._pool_manager or await self._get_pool_manager()
             async with pool_manager.session_context() as session:
                 async with session.post(
-                    self.endpoint, json=payload, headers=headers
+                    self.endpoint, data=body, headers=headers
                 ) as response:
                     if response.status == 200:
                         try:
-                            # Use response limiter for safe JSON reading with size limits
-                            result = await self.response_limiter.read_json_response(response)
+                            # Use response limiter for safe reading with size limits
+                            raw = await self.response_limiter.read_bytes_response(response)
                         except ResponseSizeLimitError as e:
                             # Handle responses that exceed size limits
                             raise GraphQLError(f"Response too large: {str(e)}")
+
+                        try:
+                            result = await self.response_limiter.parse_json(raw)
                         except ValueError as e:
-                            # Handle malformed JSON responses with limited error text
-                            try:
-                                error_text = await self.response_limiter.read_text_response(response)
-                            except ResponseSizeLimitError:
-                                error_text = "Error response too large to display"
+                            # The stream is consumed, so quote the body already read
+                            error_text = raw[:_ERROR_EXCERPT_BYTES].decode("utf-8", "replace")
                             raise GraphQLError(
                                 f"Invalid JSON in response: {str(e)}: {error_text}"
                             )
@@ -196,13 +291,11 @@ class XrayGraphQLClient:
                         # GraphQL can return 200 OK with errors in the response
                         # Check for GraphQL-level errors and report them
                         if "errors" in result:
-                            error_messages = [
+                            error_messages = "; ".join(
                                 error.get("message", "Unknown error")
                                 for error in result["errors"]
-                            ]
-                            raise GraphQLError(
-                                f"GraphQL errors: {'; '.join(error_messages)}"
                             )
+                            raise GraphQLError(f"GraphQL errors: {error_messages}")
 
                         return result
                     else:
@@ -219,6 +312,19 @@ class XrayGraphQLClient:
             # Network-level errors (connection, timeout, etc.)
             raise GraphQLError(f"Network error during GraphQL request: {str(e)}")
 
+    def _query_body(self, validated_query: str) -> bytes:
+        """Return the cached JSON body for a query sent without variables."""
+        body = self._query_bodies.get(validated_query)
+        if body is not None:
+            self._query_bodies.move_to_end(validated_query)
+            return body
+
+        body = _dumps({"query": validated_query})
+        self._query_bodies[validated_query] = body
+        if len(self._query_bodies) > _QUERY_BODY_CACHE_SIZE:
+            self._query_bodies.popitem(last=False)
+        return body
+
     async def execute_mutation(
         self, mutation: str, variables: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
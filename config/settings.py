@@ -17,7 +17,9 @@ Enhanced security features:
 """
 
 import os
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 # Centralized import handling
@@ -26,14 +28,21 @@ try:
 except ImportError:
     from security.credential_manager import get_secure_credentials, SecureCredentials
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a plain frozen dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Xray Cloud endpoint, shared by every config that does not override it
+_DEFAULT_BASE_URL = sys.intern("https://xray.cloud.getxray.app")
+
+
+@dataclass(frozen=True, repr=False, **_DATACLASS_SLOTS)
 class XrayConfig:
     """Configuration container for Xray MCP server settings.
 
     This dataclass holds all configuration required to connect to and
     authenticate with an Xray instance. It provides validation and
-    multiple construction methods for flexibility.
+    multiple construction methods for flexibility. Instances are frozen,
+    so they are hashable and safe to share (from_env() caches one).
 
     The configuration supports both Xray Cloud and Server instances
     through the configurable base_url parameter.
@@ -59,7 +68,17 @@ class XrayConfig:
 
     client_id: str
     client_secret: str
-    base_url: str = "https://xray.cloud.getxray.app"
+    base_url: str = _DEFAULT_BASE_URL
+    # Masked representation, computed once since instances are immutable
+    _masked: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        masked_secret = f"{self.client_secret[:4]}...{self.client_secret[-4:]}" if len(self.client_secret) > 8 else "***masked***"
+        object.__setattr__(
+            self,
+            "_masked",
+            f"XrayConfig(client_id={self.client_id[:8]}..., client_secret={masked_secret}, base_url={self.base_url})",
+        )
 
     @classmethod
     def from_env(cls) -> "XrayConfig":
@@ -82,7 +101,7 @@ class XrayConfig:
         Raises:
             ValueError: If required environment variables are missing
 
-        Complexity: O(1) - Simple environment lookups
+        Complexity: O(1) - Environment lookups on first call, cached after
 
         Example:
             # Set environment variables
@@ -91,21 +110,19 @@ class XrayConfig:
 
             # Create config
             config = XrayConfig.from_env()
+
+        Note:
+            The environment is read once and the resulting configuration is
+            cached. Call invalidate_env_cache() after changing the variables
+            (e.g. in tests) to have the next call re-read them. Failed
+            lookups are not cached.
         """
-        client_id = os.getenv("XRAY_CLIENT_ID")
-        client_secret = os.getenv("XRAY_CLIENT_SECRET")
+        return _config_from_env(cls)
 
-        # Validate required fields with clear error messages
-        if not client_id:
-            raise ValueError("XRAY_CLIENT_ID environment variable is required")
-        if not client_secret:
-            raise ValueError("XRAY_CLIENT_SECRET environment variable is required")
-
-        return cls(
-            client_id=client_id,
-            client_secret=client_secret,
-            base_url=os.getenv("XRAY_BASE_URL", "https://xray.cloud.getxray.app"),
-        )
+    @staticmethod
+    def invalidate_env_cache() -> None:
+        """Forget the cached from_env() result so the environment is re-read."""
+        _config_from_env.cache_clear()
 
     @classmethod
     def from_secure_env(cls) -> "XrayConfig":
@@ -137,14 +154,9 @@ class XrayConfig:
             base_url=secure_creds.base_url,
         )
 
-    def __str__(self) -> str:
-        """String representation with masked credentials."""
-        masked_secret = f"{self.client_secret[:4]}...{self.client_secret[-4:]}" if len(self.client_secret) > 8 else "***masked***"
-        return f"XrayConfig(client_id={self.client_id[:8]}..., client_secret={masked_secret}, base_url={self.base_url})"
-
     def __repr__(self) -> str:
-        """Representation with masked credentials."""
-        return self.__str__()
+        """Representation with masked credentials (also used by str())."""
+        return self._masked
 
     @classmethod
     def from_params(
@@ -185,5 +197,35 @@ class XrayConfig:
         return cls(
             client_id=client_id,
             client_secret=client_secret,
-            base_url=base_url or "https://xray.cloud.getxray.app",
+            base_url=base_url or _DEFAULT_BASE_URL,
         )
+
+
+@lru_cache(maxsize=None)
+def _config_from_env(cls: type) -> XrayConfig:
+    """Build a configuration from environment variables, once per class.
+
+    Args:
+        cls (type): XrayConfig or a subclass to instantiate
+
+    Returns:
+        XrayConfig: Validated configuration instance
+
+    Raises:
+        ValueError: If required environment variables are missing
+    """
+    env = os.environ
+    client_id = env.get("XRAY_CLIENT_ID")
+    client_secret = env.get("XRAY_CLIENT_SECRET")
+
+    # Validate required fields with clear error messages
+    if not client_id:
+        raise ValueError("XRAY_CLIENT_ID environment variable is required")
+    if not client_secret:
+        raise ValueError("XRAY_CLIENT_SECRET environment variable is required")
+
+    return cls(
+        client_id=client_id,
+        client_secret=client_secret,
+        base_url=env.get("XRAY_BASE_URL", _DEFAULT_BASE_URL),
+    )
@@ -9,7 +9,7 @@ from typing import Dict, Any, Optional, TypeVar, Callable, Union
 from enum import Enum
 import functools
 import logging
-import traceback
+import time
 from datetime import datetime, timezone
 
 # Handle imports for both package and direct execution
@@ -39,8 +39,12 @@ T = TypeVar("T")
 P = TypeVar("P")
 
 
-class ErrorCode(Enum):
-    """Standardized error codes for consistent error identification."""
+class ErrorCode(str, Enum):
+    """Standardized error codes for consistent error identification.
+
+    Members are strings, so they compare equal to their code values and
+    serialize to JSON without conversion.
+    """
 
     # Authentication errors
     AUTH_FAILED = "AUTH_001"
@@ -74,6 +78,8 @@ class ErrorCode(Enum):
 class ErrorContext:
     """Context information for error tracking and debugging."""
 
+    __slots__ = ("operation", "tool", "user_id", "request_id", "_created")
+
     def __init__(
         self,
         operation: str,
@@ -93,18 +99,27 @@ class ErrorContext:
         self.tool = tool
         self.user_id = user_id
         self.request_id = request_id
-        self.timestamp = datetime.now(timezone.utc).isoformat()
+        # Capture the raw time only; ISO formatting happens if it is read
+        self._created = time.time()
+
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 UTC time at which the context was created."""
+        return datetime.fromtimestamp(self._created, timezone.utc).isoformat()
 
 
 class ErrorResponse:
     """Standardized error response structure."""
 
+    __slots__ = ("error", "code", "context", "details", "trace")
+
     def __init__(
         self,
         error: Exception,
         code: ErrorCode,
         context: Optional[ErrorContext] = None,
         details: Optional[Dict[str, Any]] = None,
+        trace: Optional[str] = None,
     ):
         """Initialize error response.
 
@@ -113,11 +128,13 @@ class ErrorResponse:
             code: Error code for categorization
             context: Optional context information
             details: Optional additional details
+            trace: Optional pre-formatted stack trace
         """
         self.error = error
         self.code = code
         self.context = context
         self.details = details or {}
+        self.trace = trace
 
     def to_dict(self, include_trace: bool = False) -> Dict[str, Any]:
         """Convert to dictionary format.
@@ -128,31 +145,67 @@ class ErrorResponse:
         Returns:
             Dictionary representation of the error
         """
-        response = {
-            "error": {
-                "message": str(self.error),
-                "type": type(self.error).__name__,
-                "code": self.code.value,
-            }
+        error = {
+            "message": str(self.error),
+            "type": type(self.error).__name__,
+            "code": self.code.value,
         }
 
-        if self.context:
-            response["error"]["context"] = {
-                "operation": self.context.operation,
-                "timestamp": self.context.timestamp,
+        context = self.context
+        if context:
+            error_context = {
+                "operation": context.operation,
+                "timestamp": context.timestamp,
             }
-            if self.context.tool:
-                response["error"]["context"]["tool"] = self.context.tool
-            if self.context.request_id:
-                response["error"]["context"]["request_id"] = self.context.request_id
+            if context.tool:
+                error_context["tool"] = context.tool
+            if context.request_id:
+                error_context["request_id"] = context.request_id
+            error["context"] = error_context
 
         if self.details:
-            response["error"]["details"] = self.details
+            error["details"] = self.details
 
         if include_trace:
-            response["error"]["trace"] = traceback.format_exc()
+            # Formatted at most once; only valid while the exception is handled
+            if self.trace is None:
+                import traceback
+
+                self.trace = traceback.format_exc()
+            error["trace"] = self.trace
+
+        return {"error": error}
+
+
+# Exact exception class -> error code; subclasses resolve through their MRO
+_ERROR_CODE_BY_TYPE: Dict[type, ErrorCode] = {
+    AuthenticationError: ErrorCode.AUTH_FAILED,
+    ValidationError: ErrorCode.VALIDATION_FAILED,
+    GraphQLError: ErrorCode.GRAPHQL_ERROR,
+    ConnectionError: ErrorCode.CONNECTION_FAILED,
+    RateLimitError: ErrorCode.RATE_LIMIT,
+    TimeoutError: ErrorCode.TIMEOUT,
+    ValueError: ErrorCode.INVALID_INPUT,
+    KeyError: ErrorCode.MISSING_REQUIRED,
+}
+
 
-        return response
+@functools.lru_cache(maxsize=128)
+def _code_for_type(error_type: type) -> ErrorCode:
+    """Resolve the error code for an exception class via its MRO.
+
+    Args:
+        error_type: The exception class to resolve
+
+    Returns:
+        Code of the nearest mapped base class, or UNKNOWN_ERROR
+    """
+    for cls in error_type.__mro__:
+        code = _ERROR_CODE_BY_TYPE.get(cls)
+        if code is not None:
+            return code
+
+    return ErrorCode.UNKNOWN_ERROR
 
 
 def get_error_code(error: Exception) -> ErrorCode:
@@ -164,22 +217,24 @@ def get_error_code(error: Exception) -> ErrorCode:
     Returns:
         Appropriate error code
     """
-    error_mapping = {
-        AuthenticationError: ErrorCode.AUTH_FAILED,
-        ValidationError: ErrorCode.VALIDATION_FAILED,
-        GraphQLError: ErrorCode.GRAPHQL_ERROR,
-        ConnectionError: ErrorCode.CONNECTION_FAILED,
-        RateLimitError: ErrorCode.RATE_LIMIT,
-        TimeoutError: ErrorCode.TIMEOUT,
-        ValueError: ErrorCode.INVALID_INPUT,
-        KeyError: ErrorCode.MISSING_REQUIRED,
-    }
-
-    for error_type, code in error_mapping.items():
-        if isinstance(error, error_type):
-            return code
+    return _code_for_type(type(error))
 
-    return ErrorCode.UNKNOWN_ERROR
+
+def _format_trace(error: BaseException) -> str:
+    """Format the stack trace carried by an exception.
+
+    Args:
+        error: The exception whose traceback should be formatted
+
+    Returns:
+        Formatted traceback text, as traceback.format_exc() would produce
+    """
+    # Imported lazily: traces are only formatted on request
+    import traceback
+
+    return "".join(
+        traceback.format_exception(type(error), error, error.__traceback__)
+    )
 
 
 def standardize_error_response(
@@ -198,17 +253,25 @@ def standardize_error_response(
         Standardized error dictionary
     """
     code = get_error_code(error)
-    error_response = ErrorResponse(error, code, context)
+    error_response = ErrorResponse(
+        error,
+        code,
+        context,
+        trace=_format_trace(error) if include_trace else None,
+    )
 
     # Log the error
     log_level = (
         logging.ERROR if code != ErrorCode.VALIDATION_FAILED else logging.WARNING
     )
-    logger.log(
-        log_level,
-        f"Error in {context.operation if context else 'unknown operation'}: "
-        f"{type(error).__name__}: {str(error)}",
-    )
+    if logger.isEnabledFor(log_level):
+        logger.log(
+            log_level,
+            "Error in %s: %s: %s",
+            context.operation if context else "unknown operation",
+            type(error).__name__,
+            error,
+        )
 
     return error_response.to_dict(include_trace)
 
@@ -234,23 +297,25 @@ def error_handler(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., Union[T, Dict[str, Any]]]:
+        if raise_on_error:
+            # Errors propagate unchanged, so no try/except is needed
+            @functools.wraps(func)
+            def passthrough(*args, **kwargs) -> T:
+                return func(*args, **kwargs)
+
+            return passthrough
+
+        operation_name = operation or func.__name__
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Union[T, Dict[str, Any]]:
-            context = ErrorContext(
-                operation=operation or func.__name__,
-                tool=(
-                    args[0].__class__.__name__
-                    if args and hasattr(args[0], "__class__")
-                    else None
-                ),
-            )
-
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                if raise_on_error:
-                    raise
-
+                context = ErrorContext(
+                    operation=operation_name,
+                    tool=type(args[0]).__name__ if args else None,
+                )
                 return standardize_error_response(e, context, include_trace)
 
         return wrapper
@@ -275,23 +340,25 @@ def async_error_handler(
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., Union[T, Dict[str, Any]]]:
+        if raise_on_error:
+            # Errors propagate unchanged, so no try/except is needed
+            @functools.wraps(func)
+            async def passthrough(*args, **kwargs) -> T:
+                return await func(*args, **kwargs)
+
+            return passthrough
+
+        operation_name = operation or func.__name__
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> Union[T, Dict[str, Any]]:
-            context = ErrorContext(
-                operation=operation or func.__name__,
-                tool=(
-                    args[0].__class__.__name__
-                    if args and hasattr(args[0], "__class__")
-                    else None
-                ),
-            )
-
             try:
                 return await func(*args, **kwargs)
             except Exception as e:
-                if raise_on_error:
-                    raise
-
+                context = ErrorContext(
+                    operation=operation_name,
+                    tool=type(args[0]).__name__ if args else None,
+                )
                 return standardize_error_response(e, context, include_trace)
 
         return wrapper
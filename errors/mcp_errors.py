@@ -7,10 +7,27 @@ The error format follows a consistent structure that helps AI callers understand
 what went wrong and how to fix their requests automatically.
 """
 
-from typing import Dict, Any, Optional, Union, List
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, Union, List, Tuple
+from dataclasses import dataclass, field as dataclass_field, fields
 from enum import Enum
+import functools
 import json
+import sys
+
+try:
+    import orjson
+
+    _fast_json_loads = orjson.loads
+except ImportError:
+    _fast_json_loads = json.loads
+
+# Supported test types; the tuple keeps the order used in messages
+_VALID_TEST_TYPES = ("Manual", "Cucumber", "Generic")
+_VALID_TEST_TYPE_SET = frozenset(_VALID_TEST_TYPES)
+_VALID_TEST_TYPES_TEXT = ", ".join(_VALID_TEST_TYPES)
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a plain frozen dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class MCPErrorName(Enum):
@@ -42,8 +59,26 @@ class MCPErrorName(Enum):
     INTERNAL_ERROR = "InternalError"
 
 
-@dataclass
-class MCPErrorResponse:
+# Error names used directly by the builders below
+_NAME_INVALID_PARAMETER = MCPErrorName.INVALID_PARAMETER.value
+_NAME_MISSING_REQUIRED = MCPErrorName.MISSING_REQUIRED.value
+_NAME_NOT_FOUND = MCPErrorName.NOT_FOUND.value
+_NAME_UNSUPPORTED_COMBINATION = MCPErrorName.UNSUPPORTED_COMBINATION.value
+_NAME_RATE_LIMITED = MCPErrorName.RATE_LIMITED.value
+_NAME_TIMEOUT = MCPErrorName.TIMEOUT.value
+_NAME_AUTHENTICATION_FAILED = MCPErrorName.AUTHENTICATION_FAILED.value
+_NAME_DEPENDENCY_UNAVAILABLE = MCPErrorName.DEPENDENCY_UNAVAILABLE.value
+_NAME_INTERNAL_ERROR = MCPErrorName.INTERNAL_ERROR.value
+
+
+class _PayloadSlot:
+    """Base holding MCPErrorResponse's serialized form outside its fields."""
+
+    __slots__ = ("_payload",)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class MCPErrorResponse(_PayloadSlot):
     """Standardized MCP error response with self-correction guidance.
     
     This class provides a consistent error format that helps AI callers
@@ -69,36 +104,63 @@ class MCPErrorResponse:
     got: Optional[str] = None
     retriable: bool = False
     docs: Optional[str] = None
-    example_call: Optional[Dict[str, Any]] = None
+    # Left out of the hash so responses with example calls stay hashable
+    example_call: Optional[Dict[str, Any]] = dataclass_field(default=None, hash=False)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert error response to dictionary format.
-        
-        Returns:
-            Dictionary representation suitable for MCP responses
-        """
-        error_dict = {
+    def __post_init__(self) -> None:
+        # Serialized form, built once since instances are immutable
+        payload = {
             "error": self.name,
             "message": self.message
         }
         
         # Add optional fields if present
         if self.hint:
-            error_dict["hint"] = self.hint
+            payload["hint"] = self.hint
         if self.field:
-            error_dict["field"] = self.field
+            payload["field"] = self.field
         if self.expected:
-            error_dict["expected"] = self.expected
+            payload["expected"] = self.expected
         if self.got:
-            error_dict["got"] = self.got
+            payload["got"] = self.got
         if self.docs:
-            error_dict["docs"] = self.docs
+            payload["docs"] = self.docs
         if self.example_call:
-            error_dict["example_call"] = self.example_call
+            payload["example_call"] = self.example_call
             
-        error_dict["retriable"] = self.retriable
+        payload["retriable"] = self.retriable
+        object.__setattr__(self, "_payload", payload)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert error response to dictionary format.
         
-        return error_dict
+        Returns:
+            Dictionary representation suitable for MCP responses; a new
+            shallow copy of the payload built at construction
+        """
+        return dict(self._payload)
+    
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        # Rebuild through __init__ so copies and unpickled instances get a payload
+        return type(self), tuple(getattr(self, f.name) for f in fields(self))
+
+
+@functools.lru_cache(maxsize=32)
+def _resource_labels(resource: str) -> Tuple[str, Optional[str]]:
+    """Derive the display title and error field for a resource type.
+
+    Resource types come from a small fixed set, so each is derived once.
+
+    Args:
+        resource: Type of resource (test, execution, etc.)
+
+    Returns:
+        Tuple of the title-cased resource and "issue_id" for test or
+        execution resources, otherwise None
+    """
+    resource_lower = resource.lower()
+    is_issue = "test" in resource_lower or "execution" in resource_lower
+    return resource.title(), "issue_id" if is_issue else None
 
 
 class MCPErrorBuilder:
@@ -137,7 +199,7 @@ class MCPErrorBuilder:
             message += f" Got: {got_str}"
             
         return MCPErrorResponse(
-            name=MCPErrorName.INVALID_PARAMETER.value,
+            name=_NAME_INVALID_PARAMETER,
             message=message,
             hint=hint,
             field=field,
@@ -164,7 +226,7 @@ class MCPErrorBuilder:
             MCPErrorResponse for missing required parameter
         """
         return MCPErrorResponse(
-            name=MCPErrorName.MISSING_REQUIRED.value,
+            name=_NAME_MISSING_REQUIRED,
             message=f"Required parameter '{field}' is missing.",
             hint=hint,
             field=field,
@@ -190,11 +252,12 @@ class MCPErrorBuilder:
         Returns:
             MCPErrorResponse for not found resource
         """
+        resource_title, resource_field = _resource_labels(resource)
         return MCPErrorResponse(
-            name=MCPErrorName.NOT_FOUND.value,
-            message=f"{resource.title()} '{identifier}' not found.",
+            name=_NAME_NOT_FOUND,
+            message=f"{resource_title} '{identifier}' not found.",
             hint=hint or f"Verify the {resource} ID or key exists and you have permission to access it.",
-            field="issue_id" if "test" in resource.lower() or "execution" in resource.lower() else None,
+            field=resource_field,
             retriable=False,
             example_call=example_call
         )
@@ -216,7 +279,7 @@ class MCPErrorBuilder:
             MCPErrorResponse for unsupported parameter combination
         """
         return MCPErrorResponse(
-            name=MCPErrorName.UNSUPPORTED_COMBINATION.value,
+            name=_NAME_UNSUPPORTED_COMBINATION,
             message=message,
             hint=hint,
             retriable=False,
@@ -242,7 +305,7 @@ class MCPErrorBuilder:
             message += f" Retry after {retry_after} seconds."
             
         return MCPErrorResponse(
-            name=MCPErrorName.RATE_LIMITED.value,
+            name=_NAME_RATE_LIMITED,
             message=message,
             hint=hint or "Reduce request frequency or use smaller page sizes.",
             retriable=True
@@ -263,7 +326,7 @@ class MCPErrorBuilder:
             MCPErrorResponse for timeout
         """
         return MCPErrorResponse(
-            name=MCPErrorName.TIMEOUT.value,
+            name=_NAME_TIMEOUT,
             message=f"Operation '{operation}' exceeded timeout limit.",
             hint=hint or "Try narrowing the query scope or reducing the result limit.",
             retriable=True
@@ -282,7 +345,7 @@ class MCPErrorBuilder:
             MCPErrorResponse for authentication failure
         """
         return MCPErrorResponse(
-            name=MCPErrorName.AUTHENTICATION_FAILED.value,
+            name=_NAME_AUTHENTICATION_FAILED,
             message="Authentication with Xray API failed.",
             hint=hint or "Verify XRAY_CLIENT_ID and XRAY_CLIENT_SECRET are correct and the license is active.",
             retriable=False
@@ -303,7 +366,7 @@ class MCPErrorBuilder:
             MCPErrorResponse for dependency unavailability
         """
         return MCPErrorResponse(
-            name=MCPErrorName.DEPENDENCY_UNAVAILABLE.value,
+            name=_NAME_DEPENDENCY_UNAVAILABLE,
             message=f"{service} service is currently unavailable.",
             hint=hint or "Wait a few minutes and try again, or check service status.",
             retriable=True
@@ -328,7 +391,7 @@ class MCPErrorBuilder:
             message += f" Context: {context}"
             
         return MCPErrorResponse(
-            name=MCPErrorName.INTERNAL_ERROR.value,
+            name=_NAME_INTERNAL_ERROR,
             message=message,
             hint=hint or "Review the request parameters; if the error persists, file an issue.",
             retriable=False
@@ -359,7 +422,7 @@ class MCPValidationHelper:
             return MCPErrorBuilder.invalid_parameter(
                 field="project_key",
                 expected="string",
-                got=str(type(project_key).__name__),
+                got=type(project_key).__name__,
                 hint="Project key must be a string like 'PROJ' or 'TEST'.",
                 example_call={"tool": "create_test", "arguments": {"project_key": "PROJ", "summary": "Test title"}}
             )
@@ -391,7 +454,7 @@ class MCPValidationHelper:
             return MCPErrorBuilder.invalid_parameter(
                 field="limit",
                 expected="integer",
-                got=str(type(limit).__name__),
+                got=type(limit).__name__,
                 hint=f"Limit must be an integer between 1 and {max_limit}."
             )
         
@@ -423,21 +486,19 @@ class MCPValidationHelper:
         Returns:
             MCPErrorResponse if invalid, None if valid
         """
-        valid_types = ["Manual", "Cucumber", "Generic"]
-        
         if not isinstance(test_type, str):
             return MCPErrorBuilder.invalid_parameter(
                 field="test_type",
                 expected="string",
-                got=str(type(test_type).__name__),
-                hint=f"Test type must be one of: {', '.join(valid_types)}.",
+                got=type(test_type).__name__,
+                hint=f"Test type must be one of: {_VALID_TEST_TYPES_TEXT}.",
                 example_call={"tool": "create_test", "arguments": {"test_type": "Manual"}}
             )
         
-        if test_type not in valid_types:
+        if test_type not in _VALID_TEST_TYPE_SET:
             return MCPErrorBuilder.invalid_parameter(
                 field="test_type",
-                expected=f"one of: {', '.join(valid_types)}",
+                expected=f"one of: {_VALID_TEST_TYPES_TEXT}",
                 got=test_type,
                 hint="Use 'Manual' for step-by-step tests, 'Cucumber' for BDD, or 'Generic' for unstructured.",
                 example_call={"tool": "create_test", "arguments": {"test_type": "Manual"}}
@@ -456,6 +517,14 @@ class MCPValidationHelper:
         Returns:
             MCPErrorResponse if invalid, None if valid
         """
+        try:
+            _fast_json_loads(json_str)
+            return None
+        except ValueError:
+            pass
+        
+        # orjson is stricter than json (e.g. integers beyond 64 bits, NaN), so
+        # confirm with json and report its error message as before
         try:
             json.loads(json_str)
             return None
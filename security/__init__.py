@@ -6,32 +6,48 @@ This module provides security features for the Xray MCP server including:
 - Input validation and sanitization  
 - Security monitoring and logging
 - Credential lifecycle management
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+importing credential handling does not also pull in aiohttp or the
+sanitizer.
 """
 
-from .credential_manager import (
-    SecureCredentials,
-    CredentialManager,
-    get_secure_credentials,
-    validate_environment_credentials,
-    clear_credential_cache
-)
-
-from .response_limiter import (
-    ResponseLimits,
-    ResponseLimiter,
-    ResponseSizeLimitError,
-    get_response_limiter,
-    create_custom_limiter
-)
-
-from .input_sanitizer import (
-    SanitizationConfig,
-    InputSanitizer,
-    sanitize_input,
-    sanitize_json_input,
-    sanitize_url_input,
-    create_custom_sanitizer
-)
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'SecureCredentials': '.credential_manager',
+    'CredentialManager': '.credential_manager',
+    'get_secure_credentials': '.credential_manager',
+    'validate_environment_credentials': '.credential_manager',
+    'clear_credential_cache': '.credential_manager',
+    'ResponseLimits': '.response_limiter',
+    'ResponseLimiter': '.response_limiter',
+    'ResponseSizeLimitError': '.response_limiter',
+    'get_response_limiter': '.response_limiter',
+    'create_custom_limiter': '.response_limiter',
+    'SanitizationConfig': '.input_sanitizer',
+    'InputSanitizer': '.input_sanitizer',
+    'sanitize_input': '.input_sanitizer',
+    'sanitize_json_input': '.input_sanitizer',
+    'sanitize_url_input': '.input_sanitizer',
+    'create_custom_sanitizer': '.input_sanitizer',
+}
+
+
+def __getattr__(name):
+    """Import the owning submodule on first access and cache the name."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     'SecureCredentials',
@@ -50,4 +66,4 @@ __all__ = [
     'sanitize_json_input',
     'sanitize_url_input',
     'create_custom_sanitizer'
-]
\ No newline at end of file
+]
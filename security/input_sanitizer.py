@@ -9,6 +9,7 @@ import re
 import html
 import json
 import logging
+import unicodedata
 from typing import Optional, Any, Dict, List, Union
 from dataclasses import dataclass
 from urllib.parse import quote, unquote
@@ -391,7 +392,6 @@ class InputSanitizer:
         # Handle Unicode normalization if needed
         if self.config.allow_unicode:
             # Normalize Unicode to prevent bypass attempts
-            import unicodedata
             text = unicodedata.normalize('NFKC', text)
         else:
             # Remove non-ASCII characters
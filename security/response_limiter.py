@@ -7,10 +7,22 @@ It includes configurable limits and helpful error messages for size violations.
 
 import asyncio
 import aiohttp
+import json
 import logging
 from typing import Any, Dict, Optional
 from dataclasses import dataclass
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    # json.loads accepts UTF-8 bytes directly, so no decode step either way
+    _json_loads = json.loads
+
+# Bodies larger than this are parsed in a worker thread to keep the event loop responsive
+_OFFLOAD_PARSE_THRESHOLD = 1024 * 1024  # 1MB
+
 
 @dataclass
 class ResponseLimits:
@@ -49,23 +61,22 @@ class ResponseLimiter:
         self.limits = limits or ResponseLimits()
         self.logger = logging.getLogger(__name__)
     
-    async def read_json_response(
-        self, 
+    async def read_bytes_response(
+        self,
         response: aiohttp.ClientResponse,
         max_size: Optional[int] = None
-    ) -> Dict[str, Any]:
-        """Safely read JSON response with size limits.
+    ) -> bytes:
+        """Safely read a raw response body with size limits.
         
         Args:
             response: aiohttp response to read from
-            max_size: Optional override for max JSON size
+            max_size: Optional override for max size (defaults to JSON limit)
             
         Returns:
-            Parsed JSON response
+            Response body bytes
             
         Raises:
             ResponseSizeLimitError: If response exceeds size limits
-            ValueError: If JSON parsing fails
         """
         effective_limit = max_size or self.limits.max_json_size
         
@@ -105,19 +116,50 @@ class ResponseLimiter:
                 f"({(size / effective_limit * 100):.1f}% of limit)"
             )
         
-        # Parse JSON
-        try:
-            return response._loop.run_in_executor(
-                None, 
-                lambda: __import__('json').loads(content.decode('utf-8'))
-            ) if len(content) > 1024 * 1024 else response._loop.run_in_executor(
-                None,
-                lambda: __import__('json').loads(content.decode('utf-8'))
-            )
-        except Exception:
-            # Synchronous fallback for smaller responses
-            import json
-            return json.loads(content.decode('utf-8'))
+        return bytes(content)
+    
+    async def read_json_response(
+        self, 
+        response: aiohttp.ClientResponse,
+        max_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Safely read JSON response with size limits.
+        
+        The body is read with read_bytes_response and parsed with parse_json.
+        
+        Args:
+            response: aiohttp response to read from
+            max_size: Optional override for max JSON size
+            
+        Returns:
+            Parsed JSON response
+            
+        Raises:
+            ResponseSizeLimitError: If response exceeds size limits
+            ValueError: If JSON parsing fails
+        """
+        content = await self.read_bytes_response(response, max_size)
+        return await self.parse_json(content)
+    
+    async def parse_json(self, content: bytes) -> Any:
+        """Parse a JSON body that has already been read.
+        
+        Parses with orjson when available (falling back to the stdlib json
+        module). Bodies over 1MB are parsed in the default executor.
+        
+        Args:
+            content: Raw response body, e.g. from read_bytes_response
+            
+        Returns:
+            Parsed JSON value
+            
+        Raises:
+            ValueError: If JSON parsing fails
+        """
+        if len(content) > _OFFLOAD_PARSE_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _json_loads, content)
+        return _json_loads(content)
     
     async def read_text_response(
         self,
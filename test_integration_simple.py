@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from errors.mcp_errors import MCPErrorBuilder, MCPValidationHelper
 from validators.tool_validators import XrayToolValidators
-from errors.mcp_decorator import mcp_tool, MCPToolDecorator
+from errors.mcp_decorator import mcp_tool, _extract_field_name, _extract_got_value
 
 
 def test_error_system():
@@ -80,14 +80,14 @@ def test_error_system():
     print("\n4. Testing decorator pattern matching...")
     
     # Field extraction
-    field = MCPToolDecorator._extract_field_name("field 'project_key' is required")
+    field = _extract_field_name("field 'project_key' is required")
     if field == "project_key":
         print("   ✓ Field extraction works")
     else:
         print(f"   ✗ Field extraction failed: got '{field}'")
     
     # Value extraction  
-    value = MCPToolDecorator._extract_got_value("got: invalid_value")
+    value = _extract_got_value("got: invalid_value")
     if value == "invalid_value":
         print("   ✓ Value extraction works")
     else:
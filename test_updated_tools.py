@@ -96,11 +96,11 @@ async def test_updated_tools():
     
     # Test 4: Test error decorator pattern matching
     print("\n4. Testing decorator pattern matching...")
-    from errors.mcp_decorator import MCPToolDecorator
+    from errors.mcp_decorator import _extract_field_name, _extract_got_value
     
     # Test field name extraction
     test_error_msg = "field 'project_key' is required"
-    field_name = MCPToolDecorator._extract_field_name(test_error_msg)
+    field_name = _extract_field_name(test_error_msg)
     if field_name == "project_key":
         print(f"   ✓ Field extraction works: extracted '{field_name}'")
     else:
@@ -108,7 +108,7 @@ async def test_updated_tools():
         
     # Test value extraction
     test_error_msg = "got: invalid_value"
-    got_value = MCPToolDecorator._extract_got_value(test_error_msg)
+    got_value = _extract_got_value(test_error_msg)
     if got_value == "invalid_value":
         print(f"   ✓ Value extraction works: extracted '{got_value}'")
     else:
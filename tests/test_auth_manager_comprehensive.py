@@ -4,13 +4,14 @@ Tests cover token management, expiry handling, error scenarios, and race conditi
 """
 
 import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta, timezone
 import jwt
 import aiohttp
 
-from auth.manager import XrayAuthManager
+from auth.manager import XrayAuthManager, _extract_exp
 from exceptions import AuthenticationError
 
 
@@ -21,9 +22,11 @@ class TestAuthenticateSuccess:
 
     async def test_authenticate_200_response_strips_quotes(self, mocker):
         """Test successful auth returns stripped token and sets expiry from JWT."""
+        expiry_time = datetime.now(timezone.utc) + timedelta(hours=1)
+        jwt_token = jwt.encode({"exp": int(expiry_time.timestamp())}, "any_key", algorithm="HS256")
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='"mock_jwt_token_with_quotes"')
+        mock_response.read = AsyncMock(return_value=f'"{jwt_token}"'.encode())
         
         mock_post_context = AsyncMock()
         mock_post_context.__aenter__.return_value = mock_response
@@ -36,21 +39,18 @@ class TestAuthenticateSuccess:
         
         mocker.patch('aiohttp.ClientSession', return_value=mock_session)
         
-        expiry_time = datetime.now(timezone.utc) + timedelta(hours=1)
-        with patch('jwt.decode', return_value={"exp": int(expiry_time.timestamp())}):
-            manager = XrayAuthManager("test_id", "test_secret")
-            token = await manager.authenticate()
+        manager = XrayAuthManager("test_id", "test_secret")
+        token = await manager.authenticate()
         
-        assert token == "mock_jwt_token_with_quotes"
-        assert manager.token == "mock_jwt_token_with_quotes"
-        assert manager.token_expiry is not None
-        assert manager.token_expiry <= expiry_time + timedelta(seconds=1)
+        assert token == jwt_token
+        assert manager.token == jwt_token
+        assert manager.token_expiry == expiry_time.replace(microsecond=0)
 
     async def test_authenticate_jwt_decode_fallback(self, mocker):
         """Test fallback to 1-hour expiry when JWT decode fails."""
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='"invalid_jwt_token"')
+        mock_response.read = AsyncMock(return_value=b'"invalid_jwt_token"')
         
         mock_post_context = AsyncMock()
         mock_post_context.__aenter__.return_value = mock_response
@@ -195,6 +195,17 @@ class TestGetValidToken:
         assert token == "cached_token"
         mock_auth.assert_not_called()
 
+    async def test_get_valid_token_valid_token_skips_refresh_wait(self, mocker):
+        """Test a valid token is returned even while a refresh is in flight."""
+        manager = XrayAuthManager("test_id", "test_secret")
+        manager.token = "cached_token"
+        manager.token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+        manager._refresh_task = asyncio.get_running_loop().create_future()
+
+        token = await asyncio.wait_for(manager.get_valid_token(), timeout=1)
+
+        assert token == "cached_token"
+
     async def test_get_valid_token_refreshes_when_expired(self, mocker):
         """Test expired token triggers refresh."""
         manager = XrayAuthManager("test_id", "test_secret")
@@ -267,6 +278,27 @@ class TestGetValidToken:
         assert all(r == "authenticated_token" for r in results)
         assert auth_call_count == 1  # Only one auth despite concurrent calls
 
+    async def test_concurrent_failed_refresh_single_auth(self, mocker):
+        """Test a failing refresh is attempted once and raised to every caller."""
+        manager = XrayAuthManager("test_id", "test_secret")
+        auth_call_count = 0
+
+        async def mock_authenticate():
+            nonlocal auth_call_count
+            auth_call_count += 1
+            await asyncio.sleep(0.01)
+            raise AuthenticationError("Invalid credentials")
+
+        mocker.patch.object(manager, 'authenticate', mock_authenticate)
+
+        results = await asyncio.gather(
+            *(manager.get_valid_token() for _ in range(5)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, AuthenticationError) for r in results)
+        assert auth_call_count == 1
+        assert manager._refresh_task is None
+
 
 @pytest.mark.asyncio
 @pytest.mark.unit
@@ -285,6 +317,19 @@ class TestTokenExpiry:
         manager.token_expiry = datetime.now(timezone.utc) - timedelta(minutes=1)
         assert manager._is_token_expired() is True
 
+    def test_extract_exp_reads_payload(self):
+        """Test exp is read from the JWT payload without verifying it."""
+        token = jwt.encode({"exp": 1700000000, "sub": "client"}, "any_key", algorithm="HS256")
+        assert _extract_exp(token) == 1700000000.0
+
+    def test_extract_exp_invalid_or_missing(self):
+        """Test malformed tokens and tokens without a numeric exp yield None."""
+        assert _extract_exp("not_a_jwt") is None
+        assert _extract_exp("a.!!!not-base64!!!.c") is None
+        assert _extract_exp("a.bm90IGpzb24.c") is None  # "not json"
+        assert _extract_exp(jwt.encode({"sub": "client"}, "k", algorithm="HS256")) is None
+        assert _extract_exp(jwt.encode({"exp": "soon"}, "k", algorithm="HS256")) is None
+
     def test_is_token_expired_within_buffer(self):
         """Test expiry within 5-minute buffer is considered expired."""
         manager = XrayAuthManager("test_id", "test_secret")
@@ -292,16 +337,12 @@ class TestTokenExpiry:
         
         # Test at exactly 5 minutes
         manager.token_expiry = now + timedelta(minutes=5)
-        with patch('auth.manager.datetime') as mock_dt:
-            mock_dt.now.return_value = now
-            mock_dt.timezone = timezone
+        with patch('auth.manager.time.time', return_value=now.timestamp()):
             assert manager._is_token_expired() is True
         
         # Test at 4 minutes 59 seconds
         manager.token_expiry = now + timedelta(minutes=4, seconds=59)
-        with patch('auth.manager.datetime') as mock_dt:
-            mock_dt.now.return_value = now
-            mock_dt.timezone = timezone
+        with patch('auth.manager.time.time', return_value=now.timestamp()):
             assert manager._is_token_expired() is True
 
     def test_is_token_expired_outside_buffer(self):
@@ -311,16 +352,12 @@ class TestTokenExpiry:
         
         # Test at 5 minutes 1 second
         manager.token_expiry = now + timedelta(minutes=5, seconds=1)
-        with patch('auth.manager.datetime') as mock_dt:
-            mock_dt.now.return_value = now
-            mock_dt.timezone = timezone
+        with patch('auth.manager.time.time', return_value=now.timestamp()):
             assert manager._is_token_expired() is False
         
         # Test at 1 hour
         manager.token_expiry = now + timedelta(hours=1)
-        with patch('auth.manager.datetime') as mock_dt:
-            mock_dt.now.return_value = now
-            mock_dt.timezone = timezone
+        with patch('auth.manager.time.time', return_value=now.timestamp()):
             assert manager._is_token_expired() is False
 
 
@@ -337,13 +374,15 @@ class TestAuthManagerIntegration:
         
         # First auth returns token expiring in 10 minutes
         first_expiry = datetime.now(timezone.utc) + timedelta(minutes=10)
-        first_token = '"first_token"'
+        first_token = jwt.encode({"exp": int(first_expiry.timestamp())}, "k", algorithm="HS256")
         
         # Second auth returns token expiring in 1 hour
         second_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
-        second_token = '"second_token"'
+        second_token = jwt.encode({"exp": int(second_expiry.timestamp())}, "k", algorithm="HS256")
         
-        mock_response.text = AsyncMock(side_effect=[first_token, second_token])
+        mock_response.read = AsyncMock(
+            side_effect=[f'"{first_token}"'.encode(), f'"{second_token}"'.encode()]
+        )
         
         mock_post_context = AsyncMock()
         mock_post_context.__aenter__.return_value = mock_response
@@ -353,25 +392,23 @@ class TestAuthManagerIntegration:
         mock_session.__aexit__.return_value = None
         mocker.patch('aiohttp.ClientSession', return_value=mock_session)
         
-        with patch('jwt.decode', side_effect=[
-            {"exp": int(first_expiry.timestamp())},
-            {"exp": int(second_expiry.timestamp())}
-        ]):
-            manager = XrayAuthManager("test_id", "test_secret")
-            
-            # First call authenticates
-            token1 = await manager.get_valid_token()
-            assert token1 == "first_token"
-            
-            # Fast forward to within buffer (triggers refresh)
-            manager.token_expiry = datetime.now(timezone.utc) + timedelta(minutes=3)
-            token2 = await manager.get_valid_token()
-            assert token2 == "second_token"
+        manager = XrayAuthManager("test_id", "test_secret")
+        
+        # First call authenticates
+        token1 = await manager.get_valid_token()
+        assert token1 == first_token
+        assert manager.token_expiry == first_expiry.replace(microsecond=0)
+        
+        # Fast forward to within buffer (triggers refresh)
+        manager.token_expiry = datetime.now(timezone.utc) + timedelta(minutes=3)
+        token2 = await manager.get_valid_token()
+        assert token2 == second_token
+        assert manager.token_expiry == second_expiry.replace(microsecond=0)
 
     async def test_auth_with_custom_base_url(self, mocker):
         """Test authentication with custom server URL."""
         custom_url = "https://jira.company.com"
-        mock_response = AsyncMock(status=200, text=AsyncMock(return_value='"token"'))
+        mock_response = AsyncMock(status=200, read=AsyncMock(return_value=b'"token"'))
         
         mock_post_context = AsyncMock()
         mock_post_context.__aenter__.return_value = mock_response
@@ -391,4 +428,5 @@ class TestAuthManagerIntegration:
         # Verify correct URL was used
         mock_session.post.assert_called_once()
         call_args = mock_session.post.call_args
-        assert call_args[0][0] == f"{custom_url}/api/v2/authenticate"
\ No newline at end of file
+        assert call_args[0][0] == f"{custom_url}/api/v2/authenticate"
+        assert json.loads(call_args[1]["data"]) == {"client_id": "id", "client_secret": "secret"}
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""Unit tests for XrayConfig construction."""
+
+import pytest
+
+from config import XrayConfig
+
+
+@pytest.fixture(autouse=True)
+def reset_env_cache():
+    """Make every test read the environment afresh."""
+    XrayConfig.invalidate_env_cache()
+    yield
+    XrayConfig.invalidate_env_cache()
+
+
+@pytest.fixture
+def xray_env(monkeypatch):
+    """Provide a complete set of Xray environment variables."""
+    monkeypatch.setenv("XRAY_CLIENT_ID", "client-id-123456")
+    monkeypatch.setenv("XRAY_CLIENT_SECRET", "client-secret-123456")
+    monkeypatch.setenv("XRAY_BASE_URL", "https://jira.company.com")
+    return monkeypatch
+
+
+@pytest.mark.unit
+class TestFromEnv:
+    """Test suite for XrayConfig.from_env."""
+
+    def test_reads_environment(self, xray_env):
+        """Values come from the XRAY_* environment variables."""
+        config = XrayConfig.from_env()
+
+        assert config.client_id == "client-id-123456"
+        assert config.client_secret == "client-secret-123456"
+        assert config.base_url == "https://jira.company.com"
+
+    def test_result_is_cached(self, xray_env):
+        """Later calls reuse the first snapshot of the environment."""
+        first = XrayConfig.from_env()
+        xray_env.setenv("XRAY_BASE_URL", "https://other.example.com")
+
+        assert XrayConfig.from_env() is first
+
+    def test_invalidate_rereads_environment(self, xray_env):
+        """invalidate_env_cache makes the next call see new values."""
+        XrayConfig.from_env()
+        xray_env.setenv("XRAY_BASE_URL", "https://other.example.com")
+        XrayConfig.invalidate_env_cache()
+
+        assert XrayConfig.from_env().base_url == "https://other.example.com"
+
+    def test_missing_variable_not_cached(self, monkeypatch):
+        """A missing variable raises, and a later fix is picked up."""
+        monkeypatch.delenv("XRAY_CLIENT_ID", raising=False)
+        monkeypatch.setenv("XRAY_CLIENT_SECRET", "client-secret-123456")
+
+        with pytest.raises(ValueError, match="XRAY_CLIENT_ID"):
+            XrayConfig.from_env()
+
+        monkeypatch.setenv("XRAY_CLIENT_ID", "client-id-123456")
+        assert XrayConfig.from_env().client_id == "client-id-123456"
+
+
+@pytest.mark.unit
+class TestXrayConfigInstance:
+    """Test suite for XrayConfig instances."""
+
+    def test_is_immutable_and_hashable(self):
+        """Configs can't be modified and can be used as dict keys."""
+        config = XrayConfig.from_params("client-id-123456", "client-secret-123456")
+
+        with pytest.raises(AttributeError):
+            config.base_url = "https://other.example.com"
+        assert hash(config) == hash(XrayConfig.from_params("client-id-123456", "client-secret-123456"))
+
+    def test_repr_and_str_mask_credentials(self):
+        """Neither repr nor str exposes the full secret."""
+        config = XrayConfig.from_params("client-id-123456", "client-secret-123456")
+
+        assert "client-secret-123456" not in repr(config)
+        assert str(config) == repr(config)
+        assert "clie...3456" in repr(config)
+
+    def test_short_secret_fully_masked(self):
+        """Secrets of 8 characters or fewer are not partially shown."""
+        config = XrayConfig.from_params("client-id", "short")
+
+        assert "***masked***" in repr(config)
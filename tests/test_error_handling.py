@@ -4,6 +4,7 @@ This module tests the error handling implementation to ensure
 consistent behavior across the application.
 """
 
+import json
 import pytest
 from typing import Dict, Any
 from unittest.mock import Mock, patch
@@ -93,6 +94,13 @@ class TestErrorContext:
         assert context.user_id is None
         assert context.request_id is None
 
+    def test_timestamp_reflects_creation_time(self):
+        """Test that the lazily formatted timestamp is the creation time."""
+        with patch("errors.handlers.time.time", return_value=0.0):
+            context = ErrorContext(operation="test")
+
+        assert context.timestamp == "1970-01-01T00:00:00+00:00"
+
 
 class TestErrorResponse:
     """Test error response functionality."""
@@ -108,6 +116,19 @@ class TestErrorResponse:
         assert result["error"]["type"] == "ValueError"
         assert result["error"]["code"] == "VAL_002"
 
+    def test_error_response_serializes_code_as_string(self):
+        """Test that the error code serializes as its plain string value."""
+        response = ErrorResponse(ValueError("Test error"), ErrorCode.INVALID_INPUT)
+
+        assert json.loads(json.dumps(response.to_dict()))["error"]["code"] == "VAL_002"
+
+    def test_error_response_code_is_plain_string(self):
+        """Test that the code formats as its value, not the enum member."""
+        code = ErrorResponse(ValueError("Test error"), ErrorCode.INVALID_INPUT).to_dict()["error"]["code"]
+
+        assert type(code) is str
+        assert f"{code}" == "VAL_002"
+
     def test_error_response_with_context(self):
         """Test error response with context."""
         error = ValidationError("Missing field")
@@ -171,6 +192,17 @@ class TestGetErrorCode:
         error = RuntimeError("Unknown error")
         assert get_error_code(error) == ErrorCode.UNKNOWN_ERROR
 
+    def test_subclass_uses_nearest_mapped_base(self):
+        """Test that subclasses map through their nearest mapped base."""
+
+        class ExpiredTokenError(AuthenticationError):
+            pass
+
+        assert get_error_code(ExpiredTokenError("expired")) == ErrorCode.AUTH_FAILED
+        assert get_error_code(UnicodeDecodeError("utf-8", b"", 0, 1, "bad")) == (
+            ErrorCode.INVALID_INPUT
+        )
+
 
 class TestStandardizeErrorResponse:
     """Test error standardization."""
@@ -202,6 +234,28 @@ class TestStandardizeErrorResponse:
         assert result["error"]["context"]["tool"] == "TestTools"
         assert result["error"]["context"]["request_id"] == "req123"
 
+    @patch("errors.handlers.logger")
+    def test_standardize_skips_disabled_log_level(self, mock_logger):
+        """Test that nothing is logged when the level is disabled."""
+        mock_logger.isEnabledFor.return_value = False
+
+        result = standardize_error_response(GraphQLError("Query failed"))
+
+        assert result["error"]["code"] == "GQL_001"
+        mock_logger.log.assert_not_called()
+
+    @patch("errors.handlers.logger")
+    def test_standardize_trace_outside_except_block(self, mock_logger):
+        """Test that the trace comes from the error, not the handled exception."""
+        try:
+            raise RuntimeError("Captured failure")
+        except RuntimeError as e:
+            error = e
+
+        result = standardize_error_response(error, include_trace=True)
+
+        assert "RuntimeError: Captured failure" in result["error"]["trace"]
+
     @patch("errors.handlers.logger")
     def test_standardize_validation_error_logging(self, mock_logger):
         """Test that validation errors are logged as warnings."""
@@ -209,9 +263,7 @@ class TestStandardizeErrorResponse:
         standardize_error_response(error)
 
         # Should log as WARNING, not ERROR
-        from unittest.mock import ANY
-
-        mock_logger.log.assert_called_with(ANY, ANY)  # logging.WARNING
+        mock_logger.log.assert_called_once()  # logging.WARNING
         call_args = mock_logger.log.call_args
         assert call_args[0][0] == 30  # logging.WARNING = 30
 
@@ -253,6 +305,18 @@ class TestErrorHandler:
 
         assert result == {"result": "success"}
 
+    def test_sync_error_handler_success_skips_context(self):
+        """Test that no error context is built when the call succeeds."""
+
+        @error_handler()
+        def successful_function():
+            return {"result": "success"}
+
+        with patch("errors.handlers.ErrorContext") as mock_context:
+            assert successful_function() == {"result": "success"}
+
+        mock_context.assert_not_called()
+
     def test_sync_error_handler_with_operation(self):
         """Test sync error handler with custom operation name."""
 
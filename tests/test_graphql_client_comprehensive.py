@@ -3,13 +3,17 @@
 Tests cover query execution, error handling, and edge cases.
 """
 
+import asyncio
+import json
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
 
 from client.graphql import XrayGraphQLClient
 from auth.manager import XrayAuthManager
 from exceptions import GraphQLError
+from security.response_limiter import ResponseLimiter
 
 
 @pytest.fixture
@@ -76,7 +80,7 @@ class TestExecuteQuerySuccess:
         
         # Verify variables were included in payload
         call_args = mock_session.post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert payload["variables"] == variables
         assert "query" in payload
 
@@ -312,7 +316,7 @@ class TestExecuteQueryEdgeCases:
         
         # Verify variables not included when None
         call_args = mock_session.post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert "variables" not in payload
 
     async def test_execute_query_empty_variables(self, mock_auth_manager, mocker):
@@ -335,7 +339,7 @@ class TestExecuteQueryEdgeCases:
         
         # Empty dict should not be included
         call_args = mock_session.post.call_args
-        payload = call_args[1]["json"]
+        payload = json.loads(call_args[1]["data"])
         assert "variables" not in payload
 
     async def test_execute_query_malformed_json_response(self, mock_auth_manager, mocker):
@@ -445,4 +449,173 @@ class TestGraphQLClientIntegration:
         
         # All should succeed with different results
         for i, result in enumerate(results):
-            assert result == {"data": {"test": i}}
\ No newline at end of file
+            assert result == {"data": {"test": i}}
+
+
+def _client_with_mock_transport(auth_manager):
+    """Build a client whose validator, pool and limiter are mocked out."""
+    client = XrayGraphQLClient(auth_manager)
+    client.validator = MagicMock(validate_query=lambda query, variables: query)
+    client.response_limiter = ResponseLimiter()
+    client.response_limiter.read_bytes_response = AsyncMock(
+        return_value=b'{"data": {"ok": true}}'
+    )
+
+    mock_response = AsyncMock(status=200)
+    mock_post_context = AsyncMock()
+    mock_post_context.__aenter__.return_value = mock_response
+    mock_post_context.__aexit__.return_value = None
+    mock_session = MagicMock()
+    mock_session.post = MagicMock(return_value=mock_post_context)
+
+    @asynccontextmanager
+    async def session_context():
+        yield mock_session
+
+    client._pool_manager = MagicMock(session_context=session_context)
+    return client, mock_session
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestRequestHeaders:
+    """Test reuse of request headers across calls."""
+
+    async def test_headers_reused_while_token_unchanged(self, mock_auth_manager):
+        """The same headers dict is sent while the token stays the same."""
+        client, session = _client_with_mock_transport(mock_auth_manager)
+
+        await client.execute_query("query { a }")
+        await client.execute_query("query { b }")
+
+        first, second = (c[1]["headers"] for c in session.post.call_args_list)
+        assert first is second
+        assert first["Authorization"] == "Bearer valid_token"
+
+    async def test_headers_rebuilt_when_token_changes(self, mock_auth_manager):
+        """A refreshed token produces new Authorization headers."""
+        client, session = _client_with_mock_transport(mock_auth_manager)
+
+        await client.execute_query("query { a }")
+        mock_auth_manager.get_valid_token.return_value = "refreshed_token"
+        await client.execute_query("query { a }")
+
+        headers = session.post.call_args_list[-1][1]["headers"]
+        assert headers["Authorization"] == "Bearer refreshed_token"
+        assert headers["Content-Type"] == "application/json"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestMalformedResponse:
+    """Test reporting of 200 responses that are not valid JSON."""
+
+    async def test_error_quotes_body_read_once(self, mock_auth_manager):
+        """The error includes an excerpt of the body that was already read."""
+        client, _ = _client_with_mock_transport(mock_auth_manager)
+        client.response_limiter.read_bytes_response = AsyncMock(
+            return_value=b"<html>Gateway error</html>" + b"x" * 1000
+        )
+
+        with pytest.raises(GraphQLError, match="Invalid JSON in response") as exc_info:
+            await client.execute_query("query { a }")
+
+        message = str(exc_info.value)
+        assert "<html>Gateway error</html>" in message
+        assert "x" * 600 not in message
+        client.response_limiter.read_bytes_response.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestExecuteMany:
+    """Test batched query execution."""
+
+    async def test_execute_many_fetches_token_once(self, mock_auth_manager):
+        """A batch shares one token lookup and returns results in order."""
+        client, session = _client_with_mock_transport(mock_auth_manager)
+        client.response_limiter.read_bytes_response = AsyncMock(
+            side_effect=[b'{"data": {"n": 1}}', b'{"data": {"n": 2}}']
+        )
+
+        results = await client.execute_many([
+            ("query { a }", {"id": "1"}),
+            ("query { b }", None),
+        ])
+
+        assert results == [{"data": {"n": 1}}, {"data": {"n": 2}}]
+        mock_auth_manager.get_valid_token.assert_awaited_once()
+        assert session.post.call_count == 2
+
+    async def test_execute_many_bounds_concurrency(self, mock_auth_manager):
+        """No more than max_concurrency requests are in flight at once."""
+        client, _ = _client_with_mock_transport(mock_auth_manager)
+        in_flight = 0
+        peak = 0
+
+        async def tracking_read(response):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return b'{"data": {"ok": true}}'
+
+        client.response_limiter.read_bytes_response = tracking_read
+
+        results = await client.execute_many(
+            [("query { a }", {"n": i}) for i in range(10)], max_concurrency=3
+        )
+
+        assert len(results) == 10
+        assert peak == 3
+
+    async def test_execute_many_validates_before_sending(self, mock_auth_manager):
+        """An invalid query fails the batch before any request is sent."""
+        client, session = _client_with_mock_transport(mock_auth_manager)
+
+        def validate(query, variables):
+            if "bad" in query:
+                raise ValueError("blocked")
+            return query
+
+        client.validator = MagicMock(validate_query=validate)
+
+        with pytest.raises(GraphQLError, match="validation failed"):
+            await client.execute_many([("query { a }", None), ("query { bad }", None)])
+
+        mock_auth_manager.get_valid_token.assert_not_called()
+        session.post.assert_not_called()
+
+    async def test_execute_many_empty(self, mock_auth_manager):
+        """An empty batch returns an empty list without authenticating."""
+        client, _ = _client_with_mock_transport(mock_auth_manager)
+
+        assert await client.execute_many([]) == []
+        mock_auth_manager.get_valid_token.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestRequestBody:
+    """Test request body serialization."""
+
+    async def test_body_includes_variables(self, mock_auth_manager):
+        """Variables are serialized alongside the query."""
+        client, session = _client_with_mock_transport(mock_auth_manager)
+
+        await client.execute_query("query { a }", {"id": "1"})
+
+        body = json.loads(session.post.call_args[1]["data"])
+        assert body == {"query": "query { a }", "variables": {"id": "1"}}
+
+    async def test_variable_free_body_reused(self, mock_auth_manager):
+        """Queries without variables reuse one serialized body."""
+        client, session = _client_with_mock_transport(mock_auth_manager)
+
+        await client.execute_query("query { a }")
+        await client.execute_query("query { a }", {})
+
+        first, second = (c[1]["data"] for c in session.post.call_args_list)
+        assert first is second
+        assert json.loads(first) == {"query": "query { a }"}
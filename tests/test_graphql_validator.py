@@ -0,0 +1,62 @@
+"""Unit tests for GraphQLValidator query caching."""
+
+import pytest
+from unittest.mock import patch
+
+from validators.graphql_validator import GraphQLValidator
+from exceptions import ValidationError
+
+
+QUERY = """
+query GetTests($jql: String!) {
+    getTests(jql: $jql, limit: 10) {
+        total
+        results { issueId }
+    }
+}
+"""
+
+
+@pytest.mark.unit
+class TestValidatedQueryCache:
+    """Test suite for the validated-query LRU cache."""
+
+    def test_repeat_query_skips_structural_checks(self):
+        """A query that already passed is not parsed again."""
+        validator = GraphQLValidator()
+        first = validator.validate_query(QUERY, {"jql": "project = A"})
+
+        with patch.object(validator, "_parse_query", wraps=validator._parse_query) as parse:
+            second = validator.validate_query(QUERY, {"jql": "project = B"})
+
+        assert first == second == QUERY.strip()
+        parse.assert_not_called()
+
+    def test_variables_validated_on_cache_hit(self):
+        """Cached queries still reject dangerous variables."""
+        validator = GraphQLValidator()
+        validator.validate_query(QUERY, {"jql": "project = A"})
+
+        with pytest.raises(ValidationError):
+            validator.validate_query(QUERY, {"jql": "<script>alert(1)</script>"})
+
+    def test_invalid_query_not_cached(self):
+        """Rejected queries are re-checked (and rejected) every time."""
+        validator = GraphQLValidator()
+
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                validator.validate_query("query { __schema { types { name } } }")
+
+        assert len(validator._validated_queries) == 0
+
+    def test_cache_is_bounded(self):
+        """The cache evicts the least recently used query."""
+        validator = GraphQLValidator()
+        validator.VALIDATED_QUERY_CACHE_SIZE = 2
+        queries = [f"query Q{i} {{ getTests(jql: \"x\") {{ total }} }}" for i in range(3)]
+
+        for query in queries:
+            validator.validate_query(query)
+
+        assert list(validator._validated_queries) == queries[1:]
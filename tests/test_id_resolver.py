@@ -0,0 +1,282 @@
+"""Unit tests for IssueIdResolver caching behaviour."""
+
+import asyncio
+import gc
+import pytest
+from unittest.mock import AsyncMock
+
+try:
+    from utils.id_resolver import IssueIdResolver
+    from exceptions import GraphQLError
+except ImportError:
+    import sys
+    import os
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from utils.id_resolver import IssueIdResolver
+    from exceptions import GraphQLError
+
+
+def _tests_response(issue_id):
+    """Build a getTests response resolving to a single issue ID."""
+    return {"data": {"getTests": {"results": [{"issueId": issue_id}]}}}
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock GraphQL client that resolves every key to 1000."""
+    client = AsyncMock()
+    client.execute_query = AsyncMock(return_value=_tests_response("1000"))
+    return client
+
+
+class TestIssueIdResolverCache:
+    """Test suite for the resolver's LRU cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_api_call(self, mock_client):
+        """A resolved key is served from cache on the next lookup."""
+        resolver = IssueIdResolver(mock_client)
+
+        assert await resolver.resolve_issue_id("TEST-1") == "1000"
+        assert await resolver.resolve_issue_id("TEST-1") == "1000"
+
+        assert mock_client.execute_query.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_numeric_ids_are_not_cached(self, mock_client):
+        """Numeric IDs are returned as-is without touching the cache."""
+        resolver = IssueIdResolver(mock_client)
+
+        assert await resolver.resolve_issue_id("12345") == "12345"
+        assert resolver.get_cache_stats()["cache_size"] == 0
+        mock_client.execute_query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, mock_client):
+        """The cache stays bounded and evicts the oldest unused key."""
+        resolver = IssueIdResolver(mock_client, max_cache_size=2)
+
+        await resolver.resolve_issue_id("TEST-1")
+        await resolver.resolve_issue_id("TEST-2")
+        # Touch TEST-1 so TEST-2 becomes the least recently used entry
+        await resolver.resolve_issue_id("TEST-1")
+        await resolver.resolve_issue_id("TEST-3")
+
+        stats = resolver.get_cache_stats()
+        assert stats["cache_size"] == 2
+        assert stats["max_cache_size"] == 2
+        assert stats["cached_keys"] == ["TEST-1", "TEST-3"]
+
+    @pytest.mark.asyncio
+    async def test_clear_cache(self, mock_client):
+        """clear_cache empties the cache."""
+        resolver = IssueIdResolver(mock_client)
+        await resolver.resolve_issue_id("TEST-1")
+
+        resolver.clear_cache()
+
+        assert resolver.get_cache_stats()["cache_size"] == 0
+
+
+class TestIssueIdResolverSingleFlight:
+    """Test suite for de-duplication of concurrent lookups."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self, mock_client):
+        """Concurrent resolves of the same key issue a single API call."""
+        async def slow_query(query, variables):
+            await asyncio.sleep(0)
+            return _tests_response("1000")
+
+        mock_client.execute_query = AsyncMock(side_effect=slow_query)
+        resolver = IssueIdResolver(mock_client)
+
+        results = await asyncio.gather(
+            *(resolver.resolve_issue_id("TEST-1") for _ in range(5))
+        )
+
+        assert results == ["1000"] * 5
+        assert mock_client.execute_query.await_count == 1
+        assert resolver._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_lookup_propagates_to_all_waiters(self, mock_client):
+        """A failed resolution raises for every waiter and is not cached."""
+        async def empty_query(query, variables):
+            await asyncio.sleep(0)
+            return {"data": {}}
+
+        mock_client.execute_query = AsyncMock(side_effect=empty_query)
+        resolver = IssueIdResolver(mock_client)
+
+        results = await asyncio.gather(
+            resolver.resolve_issue_id("TEST-404"),
+            resolver.resolve_issue_id("TEST-404"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, GraphQLError) for r in results)
+        assert resolver.get_cache_stats()["cache_size"] == 0
+
+
+    @pytest.mark.asyncio
+    async def test_failure_with_cancelled_waiters_is_retrieved(self, mock_client):
+        """A lookup that fails after its waiters are cancelled logs nothing."""
+        release = asyncio.Event()
+
+        async def blocked_query(query, variables):
+            await release.wait()
+            raise RuntimeError("boom")
+
+        mock_client.execute_query = AsyncMock(side_effect=blocked_query)
+        resolver = IssueIdResolver(mock_client)
+        loop = asyncio.get_running_loop()
+        unhandled = []
+        loop.set_exception_handler(lambda _, context: unhandled.append(context))
+
+        waiter = asyncio.ensure_future(resolver.resolve_issue_id("TEST-1"))
+        await asyncio.sleep(0)
+        task = resolver._inflight["TEST-1"]
+        waiter.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        while not task.done():
+            await asyncio.sleep(0)
+        # Let the done callbacks run
+        await asyncio.sleep(0)
+        del task, waiter
+        gc.collect()
+
+        loop.set_exception_handler(None)
+        assert resolver._inflight == {}
+        assert unhandled == []
+
+
+class TestResolveMultipleIssueIds:
+    """Test suite for bulk resolution."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_concurrently_in_order(self, mock_client):
+        """Keys are resolved concurrently and returned in input order."""
+        in_flight = 0
+        peak = 0
+
+        async def tracking_query(query, variables):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            key = variables["jql"].split('"')[1]
+            return _tests_response(key.split("-")[1] + "00")
+
+        mock_client.execute_query = AsyncMock(side_effect=tracking_query)
+        resolver = IssueIdResolver(mock_client)
+
+        result = await resolver.resolve_multiple_issue_ids(["TEST-1", "555", "TEST-2", "TEST-1"])
+
+        assert result == ["100", "555", "200", "100"]
+        assert peak == 2
+        assert mock_client.execute_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, mock_client):
+        """Large batches never run more than the configured lookups at once."""
+        in_flight = 0
+        peak = 0
+
+        async def tracking_query(query, variables):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return _tests_response("1000")
+
+        mock_client.execute_query = AsyncMock(side_effect=tracking_query)
+        resolver = IssueIdResolver(mock_client, max_concurrent_lookups=3)
+
+        result = await resolver.resolve_multiple_issue_ids([f"TEST-{i}" for i in range(20)])
+
+        assert result == ["1000"] * 20
+        assert peak == 3
+
+
+class TestIssueIdResolverNegativeCache:
+    """Test suite for remembering keys that failed to resolve."""
+
+    @pytest.mark.asyncio
+    async def test_failed_key_is_not_requeried_within_ttl(self, mock_client):
+        """A key that failed the fallback chain fails fast on retry."""
+        mock_client.execute_query = AsyncMock(return_value={"data": {}})
+        resolver = IssueIdResolver(mock_client)
+
+        with pytest.raises(GraphQLError):
+            await resolver.resolve_issue_id("TEST-404")
+        calls_after_first = mock_client.execute_query.await_count
+
+        with pytest.raises(GraphQLError):
+            await resolver.resolve_issue_id("TEST-404")
+
+        assert mock_client.execute_query.await_count == calls_after_first
+        assert resolver.get_cache_stats()["negative_cache_size"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Network error during GraphQL request: Connection refused",
+            "GraphQL request failed with status 503: Service Unavailable",
+            "GraphQL request failed with status 429: Too Many Requests",
+            "GraphQL errors: Internal server error",
+        ],
+    )
+    async def test_lookup_errors_are_not_remembered(self, mock_client, message):
+        """Keys whose lookups raised are retried, whatever the error."""
+        mock_client.execute_query = AsyncMock(side_effect=GraphQLError(message))
+        resolver = IssueIdResolver(mock_client)
+
+        with pytest.raises(GraphQLError) as exc_info:
+            await resolver.resolve_issue_id("TEST-1")
+        mock_client.execute_query = AsyncMock(return_value=_tests_response("1000"))
+
+        assert str(exc_info.value.__cause__) == message
+        assert resolver.get_cache_stats()["negative_cache_size"] == 0
+        assert await resolver.resolve_issue_id("TEST-1") == "1000"
+
+    @pytest.mark.asyncio
+    async def test_one_failed_method_prevents_remembering(self, mock_client):
+        """A single erroring method is enough to skip the negative cache."""
+        error = GraphQLError("GraphQL request failed with status 503: Service Unavailable")
+        mock_client.execute_query = AsyncMock(side_effect=[error] + [{"data": {}}] * 4)
+        resolver = IssueIdResolver(mock_client)
+
+        with pytest.raises(GraphQLError) as exc_info:
+            await resolver.resolve_issue_id("TEST-404")
+
+        assert exc_info.value.__cause__ is error
+        assert resolver.get_cache_stats()["negative_cache_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_key_is_retried_after_ttl(self, mock_client):
+        """Once the negative TTL lapses the key is looked up again."""
+        mock_client.execute_query = AsyncMock(return_value={"data": {}})
+        resolver = IssueIdResolver(mock_client, negative_ttl=0)
+
+        with pytest.raises(GraphQLError):
+            await resolver.resolve_issue_id("TEST-404")
+        mock_client.execute_query = AsyncMock(return_value=_tests_response("1000"))
+
+        assert await resolver.resolve_issue_id("TEST-404") == "1000"
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forgets_failures(self, mock_client):
+        """clear_cache also drops remembered failures."""
+        mock_client.execute_query = AsyncMock(return_value={"data": {}})
+        resolver = IssueIdResolver(mock_client)
+        with pytest.raises(GraphQLError):
+            await resolver.resolve_issue_id("TEST-404")
+
+        resolver.clear_cache()
+
+        assert resolver.get_cache_stats()["negative_cache_size"] == 0
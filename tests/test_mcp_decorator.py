@@ -0,0 +1,216 @@
+"""Unit tests for the MCP tool error handling decorator."""
+
+import json
+import pytest
+
+from errors.mcp_decorator import (
+    mcp_tool,
+    _extract_identifier,
+    _generate_example_call,
+    _handle_graphql_error,
+    _handle_rate_limit_error,
+    _handle_validation_error,
+)
+from exceptions import (
+    AuthenticationError,
+    GraphQLError,
+    ValidationError,
+    ConnectionError,
+    RateLimitError,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestAsyncDispatch:
+    """Test suite for exception dispatch in async tools."""
+
+    @pytest.mark.parametrize(
+        "error, expected_name",
+        [
+            (ValidationError("bad input"), "InvalidParameter"),
+            (AuthenticationError("denied"), "AuthenticationFailed"),
+            (GraphQLError("Test 'TEST-1' not found"), "NotFound"),
+            (RateLimitError("retry after 30 seconds"), "RateLimited"),
+            (ConnectionError("refused"), "DependencyUnavailable"),
+            (TimeoutError("slow"), "Timeout"),
+            (json.JSONDecodeError("Expecting value", "x", 0), "InvalidParameter"),
+            (ValueError("bad value"), "InvalidParameter"),
+            (KeyError("issue_id"), "MissingRequired"),
+            (RuntimeError("boom"), "InternalError"),
+        ],
+    )
+    async def test_error_mapped_to_mcp_response(self, error, expected_name):
+        """Each known exception type produces its structured error."""
+
+        @mcp_tool("get_test")
+        async def tool():
+            raise error
+
+        result = await tool()
+
+        assert result["error"] == expected_name
+
+    async def test_subclass_uses_base_handler(self):
+        """Subclasses of registered exceptions use the base class handler."""
+
+        class TokenExpiredError(AuthenticationError):
+            pass
+
+        @mcp_tool("get_test")
+        async def tool():
+            raise TokenExpiredError("expired")
+
+        result = await tool()
+
+        assert result["error"] == "AuthenticationFailed"
+
+    async def test_unexpected_error_response_is_fresh(self):
+        """Each unexpected error returns its own copy of the response."""
+
+        @mcp_tool("get_test")
+        async def tool():
+            raise RuntimeError("boom")
+
+        first = await tool()
+        first["message"] = "changed"
+        second = await tool()
+
+        assert second["error"] == "InternalError"
+        assert second["message"] == (
+            "An internal error occurred. Context: Unexpected error in get_test"
+        )
+
+    async def test_success_passes_through(self):
+        """Successful results are returned unchanged."""
+
+        @mcp_tool("get_test")
+        async def tool():
+            return {"issueId": "1001"}
+
+        assert await tool() == {"issueId": "1001"}
+
+
+@pytest.mark.unit
+class TestSyncDispatch:
+    """Test suite for exception dispatch in sync tools."""
+
+    @pytest.mark.parametrize(
+        "error, expected_name",
+        [
+            (ValidationError("bad input"), "InvalidParameter"),
+            (GraphQLError("Test 'TEST-1' not found"), "NotFound"),
+            (RateLimitError("slow down"), "RateLimited"),
+            (KeyError("issue_id"), "MissingRequired"),
+            (RuntimeError("boom"), "InternalError"),
+        ],
+    )
+    def test_sync_matches_async_mapping(self, error, expected_name):
+        """Sync tools map errors exactly like async tools."""
+
+        @mcp_tool("get_test")
+        def tool():
+            raise error
+
+        assert tool()["error"] == expected_name
+
+
+@pytest.mark.unit
+class TestMessageExtraction:
+    """Test suite for details extracted from error messages."""
+
+    def test_missing_field_name(self):
+        """Missing-field validation errors name the field."""
+        response = _handle_validation_error(
+            ValidationError("Required field 'summary' is missing"), "create_test", None
+        )
+
+        assert response.field == "summary"
+
+    def test_validation_category_priority(self):
+        """Missing-field errors take priority over later categories."""
+        response = _handle_validation_error(
+            ValidationError("Invalid test type: field 'summary' is required but missing"),
+            "create_test",
+            None,
+        )
+
+        assert response.name == "MissingRequired"
+        assert response.field == "summary"
+
+    def test_got_value(self):
+        """Invalid test types report the received value."""
+        response = _handle_validation_error(
+            ValidationError("Invalid test type, got: Exploratory"), "create_test", None
+        )
+
+        assert response.got == "exploratory"
+
+    def test_not_found_identifier(self):
+        """Not-found GraphQL errors report the identifier."""
+        response = _handle_graphql_error(
+            GraphQLError("Test 'TEST-123' not found"), "get_test", None
+        )
+
+        assert "TEST-123" in response.message
+
+    def test_identifier_pattern_priority(self):
+        """Quoted identifiers win over numbers appearing earlier."""
+        assert _extract_identifier(
+            "Error 404: Test 'TEST-1' not found"
+        ) == "TEST-1"
+        assert _extract_identifier("Issue 10001 not found") == "10001"
+
+    @pytest.mark.parametrize(
+        "message, resource",
+        [
+            ("Test 'TEST-1' not found", "test"),
+            ("Test execution 'TEST-2' not found", "test execution"),
+            ("Test plan 'TEST-3' does not exist", "test plan"),
+            ("Issue 'PRJ-4' not found", "resource"),
+            ("Test 'PROJ-1' not found during execution", "test"),
+            ("Test PROJ-5 not found in plan", "test"),
+            ("Attestation 'PRJ-6' not found", "resource"),
+        ],
+    )
+    def test_not_found_resource_type(self, message, resource):
+        """The most specific resource type named in the message is used."""
+        response = _handle_graphql_error(GraphQLError(message), "get_test", None)
+
+        assert response.name == "NotFound"
+        assert response.hint.startswith(f"Verify the {resource} ID")
+
+    def test_retry_after(self):
+        """Rate limit errors surface the retry delay."""
+        response = _handle_rate_limit_error(
+            RateLimitError("Too many requests, retry after 30 seconds"), "get_tests"
+        )
+
+        assert "Retry after 30 seconds" in response.message
+
+
+@pytest.mark.unit
+class TestGenerateExampleCall:
+    """Test suite for example-call generation."""
+
+    def test_params_override_without_mutating_examples(self):
+        """Overrides apply to the returned call only."""
+        call = _generate_example_call("get_tests", {"limit": 10})
+        call["arguments"]["jql"] = "changed"
+
+        assert call["arguments"]["limit"] == 10
+        assert _generate_example_call("get_tests") == {
+            "tool": "get_tests",
+            "arguments": {"jql": "project = PROJ", "limit": 50},
+        }
+
+    def test_unknown_tool_uses_params(self):
+        """Tools without a stored example echo the given params."""
+        assert _generate_example_call("custom", {"a": 1}) == {
+            "tool": "custom",
+            "arguments": {"a": 1},
+        }
+
+    def test_no_tool_name(self):
+        """No example is produced without a tool name."""
+        assert _generate_example_call(None) is None
@@ -0,0 +1,189 @@
+"""Unit tests for MCP error responses, builders and validation helpers."""
+
+import copy
+import dataclasses
+import pickle
+import sys
+import pytest
+
+from errors.mcp_errors import MCPErrorResponse, MCPErrorBuilder, MCPValidationHelper
+
+
+@pytest.mark.unit
+class TestMCPErrorResponse:
+    """Test suite for MCPErrorResponse serialization."""
+
+    def test_to_dict_omits_empty_optional_fields(self):
+        """Only populated optional fields appear, retriable always does."""
+        response = MCPErrorResponse(name="NotFound", message="Missing.", hint="Look again.")
+
+        assert response.to_dict() == {
+            "error": "NotFound",
+            "message": "Missing.",
+            "hint": "Look again.",
+            "retriable": False,
+        }
+
+    def test_to_dict_returns_independent_copies(self):
+        """Modifying one serialized dict does not affect later ones."""
+        response = MCPErrorResponse(name="Timeout", message="Slow.", retriable=True)
+
+        first = response.to_dict()
+        first["message"] = "changed"
+
+        assert response.to_dict()["message"] == "Slow."
+
+    def test_instances_are_immutable(self):
+        """Fields cannot change after the payload is built."""
+        response = MCPErrorResponse(name="Timeout", message="Slow.")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            response.message = "changed"
+
+    def test_copies_keep_their_payload(self):
+        """Copied and unpickled responses serialize like the original."""
+        response = MCPErrorResponse(
+            name="NotFound", message="Missing.", example_call={"tool": "get_test"}
+        )
+
+        assert copy.copy(response).to_dict() == response.to_dict()
+        assert pickle.loads(pickle.dumps(response)).to_dict() == response.to_dict()
+
+    def test_equal_responses_deduplicate(self):
+        """Identical responses hash equal, including their example calls."""
+        errors = [
+            MCPValidationHelper.validate_test_type("Exploratory"),
+            MCPErrorBuilder.invalid_parameter(
+                field="test_type",
+                expected="one of: Manual, Cucumber, Generic",
+                got="Exploratory",
+                hint="Use 'Manual' for step-by-step tests, 'Cucumber' for BDD, or 'Generic' for unstructured.",
+                example_call={"tool": "create_test", "arguments": {"test_type": "Manual"}},
+            ),
+            MCPErrorBuilder.missing_required(field="summary"),
+        ]
+
+        assert list(dict.fromkeys(errors)) == [errors[0], errors[2]]
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_instances_use_slots(self):
+        """Responses carry no per-instance __dict__."""
+        response = MCPErrorResponse(name="Timeout", message="Slow.")
+
+        assert not hasattr(response, "__dict__")
+
+    def test_payload_is_not_a_field(self):
+        """The cached payload stays out of fields() and asdict()."""
+        response = MCPErrorResponse(name="Timeout", message="Slow.")
+
+        assert "_payload" not in {f.name for f in dataclasses.fields(response)}
+        assert "_payload" not in dataclasses.asdict(response)
+
+
+@pytest.mark.unit
+class TestMCPErrorBuilder:
+    """Test suite for MCPErrorBuilder factories."""
+
+    def test_invalid_parameter(self):
+        """Invalid parameters report field, expectation and value."""
+        result = MCPErrorBuilder.invalid_parameter(
+            field="limit", expected="integer", got="abc", hint="Use a number."
+        ).to_dict()
+
+        assert result["error"] == "InvalidParameter"
+        assert result["message"] == "Parameter 'limit' must be integer. Got: abc"
+        assert result["field"] == "limit"
+        assert result["got"] == "abc"
+
+    def test_invalid_parameter_truncates_long_values(self):
+        """Received values over 100 characters are truncated to 100."""
+        result = MCPErrorBuilder.invalid_parameter(
+            field="summary", expected="short text", got="x" * 150
+        ).to_dict()
+
+        assert result["got"] == "x" * 97 + "..."
+
+    def test_missing_required(self):
+        """Missing parameters name the field."""
+        result = MCPErrorBuilder.missing_required(field="summary").to_dict()
+
+        assert result["error"] == "MissingRequired"
+        assert result["message"] == "Required parameter 'summary' is missing."
+
+    @pytest.mark.parametrize(
+        "resource, title, field",
+        [
+            ("test", "Test", "issue_id"),
+            ("test execution", "Test Execution", "issue_id"),
+            ("resource", "Resource", None),
+        ],
+    )
+    def test_not_found(self, resource, title, field):
+        """Not-found errors title the resource and flag issue lookups."""
+        response = MCPErrorBuilder.not_found(resource=resource, identifier="PRJ-1")
+
+        assert response.message == f"{title} 'PRJ-1' not found."
+        assert response.field == field
+
+    def test_rate_limited_with_retry_after(self):
+        """Rate limit errors include the retry delay and are retriable."""
+        result = MCPErrorBuilder.rate_limited(retry_after=30).to_dict()
+
+        assert result["error"] == "RateLimited"
+        assert result["message"] == "API rate limit exceeded. Retry after 30 seconds."
+        assert result["retriable"] is True
+
+
+@pytest.mark.unit
+class TestMCPValidationHelper:
+    """Test suite for MCPValidationHelper checks."""
+
+    @pytest.mark.parametrize("project_key", ["PROJ", "TEST123", "ÉTÉ", "PROJ²"])
+    def test_valid_project_keys(self, project_key):
+        """Uppercase alphanumeric keys are accepted."""
+        assert MCPValidationHelper.validate_project_key(project_key) is None
+
+    @pytest.mark.parametrize("project_key", ["proj", "PRO-J", "PROJ "])
+    def test_invalid_project_keys(self, project_key):
+        """Keys with lowercase or punctuation are rejected."""
+        error = MCPValidationHelper.validate_project_key(project_key)
+
+        assert error.name == "InvalidParameter"
+        assert error.got == project_key
+
+    def test_project_key_type(self):
+        """Non-string keys report their type name."""
+        assert MCPValidationHelper.validate_project_key(123).got == "int"
+
+    @pytest.mark.parametrize("test_type", ["Manual", "Cucumber", "Generic"])
+    def test_valid_test_types(self, test_type):
+        """Supported test types are accepted."""
+        assert MCPValidationHelper.validate_test_type(test_type) is None
+
+    def test_invalid_test_type(self):
+        """Unsupported test types list the valid options."""
+        error = MCPValidationHelper.validate_test_type("Exploratory")
+
+        assert error.expected == "one of: Manual, Cucumber, Generic"
+
+    def test_validate_limit(self):
+        """Limits must be integers within range."""
+        assert MCPValidationHelper.validate_limit(50) is None
+        assert MCPValidationHelper.validate_limit(0).got == "0"
+        assert MCPValidationHelper.validate_limit(101).got == "101"
+        assert MCPValidationHelper.validate_limit("5").got == "str"
+
+    def test_validate_json_string(self):
+        """Invalid JSON is reported with a truncated preview."""
+        assert MCPValidationHelper.validate_json_string('[{"a": 1}]', "steps") is None
+
+        error = MCPValidationHelper.validate_json_string("{" + "x" * 80, "steps")
+
+        assert error.field == "steps"
+        assert error.got == "{" + "x" * 49 + "..."
+
+    def test_validate_json_string_matches_stdlib_json(self):
+        """Inputs the json module accepts stay valid with a faster parser."""
+        assert MCPValidationHelper.validate_json_string(
+            '{"id": 123456789012345678901234567890, "x": NaN}', "steps"
+        ) is None
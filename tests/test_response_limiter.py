@@ -0,0 +1,66 @@
+"""Unit tests for ResponseLimiter JSON reading."""
+
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from security.response_limiter import ResponseLimiter, ResponseLimits, ResponseSizeLimitError
+
+
+def _make_response(body: bytes, headers=None):
+    """Build a mock aiohttp response that streams ``body`` in 8KB chunks."""
+    async def iter_chunked(size):
+        for start in range(0, len(body), size):
+            yield body[start:start + size]
+
+    response = MagicMock()
+    response.headers = headers or {}
+    response.content.iter_chunked = iter_chunked
+    return response
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestReadJsonResponse:
+    """Test suite for read_json_response."""
+
+    async def test_returns_parsed_dict(self):
+        """Small bodies are parsed and returned as a dict, not a future."""
+        limiter = ResponseLimiter()
+        response = _make_response(b'{"data": {"getTests": {"total": 1}}}')
+
+        result = await limiter.read_json_response(response)
+
+        assert result == {"data": {"getTests": {"total": 1}}}
+
+    async def test_large_body_parsed_off_loop(self):
+        """Bodies over the offload threshold are still fully parsed."""
+        limiter = ResponseLimiter()
+        payload = {"data": {"results": ["x" * 100] * 12000}}
+        response = _make_response(json.dumps(payload).encode("utf-8"))
+
+        result = await limiter.read_json_response(response)
+
+        assert result == payload
+
+    async def test_invalid_json_raises_value_error(self):
+        """Malformed JSON surfaces as ValueError for callers to handle."""
+        limiter = ResponseLimiter()
+
+        with pytest.raises(ValueError):
+            await limiter.read_json_response(_make_response(b"not json"))
+
+    async def test_streamed_size_limit(self):
+        """Bodies larger than the limit raise ResponseSizeLimitError."""
+        limiter = ResponseLimiter(ResponseLimits(max_json_size=16))
+
+        with pytest.raises(ResponseSizeLimitError):
+            await limiter.read_json_response(_make_response(b'{"data": "' + b"x" * 64 + b'"}'))
+
+    async def test_content_length_limit(self):
+        """An oversized content-length header is rejected before streaming."""
+        limiter = ResponseLimiter(ResponseLimits(max_json_size=16))
+        response = _make_response(b"{}", headers={"content-length": "1000"})
+
+        with pytest.raises(ResponseSizeLimitError):
+            await limiter.read_json_response(response)
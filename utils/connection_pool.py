@@ -21,18 +21,22 @@ class ConnectionPoolConfig:
     
     Attributes:
         connector_limit: Maximum number of connections in pool (default: 30)
-        connector_limit_per_host: Maximum connections per host (default: 10)
+        connector_limit_per_host: Maximum connections per host (default: 30).
+            All traffic goes to a single Xray host, so this matches
+            connector_limit rather than capping concurrent batches lower.
         timeout_total: Total timeout for requests in seconds (default: 30)
         timeout_connect: Connection timeout in seconds (default: 10)
         enable_keepalive: Enable HTTP keep-alive (default: True)
-        keepalive_timeout: Keep-alive timeout in seconds (default: 30)
+        keepalive_timeout: Keep-alive timeout in seconds (default: 75). Long
+            enough that idle TLS connections survive the gaps between tool
+            calls instead of paying a new handshake each time.
     """
     connector_limit: int = 30
-    connector_limit_per_host: int = 10
+    connector_limit_per_host: int = 30
     timeout_total: float = 30.0
     timeout_connect: float = 10.0
     enable_keepalive: bool = True
-    keepalive_timeout: float = 30.0
+    keepalive_timeout: float = 75.0
 
 
 class ConnectionPoolManager:
@@ -96,7 +100,8 @@ class ConnectionPoolManager:
             limit=self.config.connector_limit,
             limit_per_host=self.config.connector_limit_per_host,
             enable_cleanup_closed=True,
-            keepalive_timeout=self.config.keepalive_timeout if self.config.enable_keepalive else 0,
+            force_close=not self.config.enable_keepalive,
+            keepalive_timeout=self.config.keepalive_timeout if self.config.enable_keepalive else None,
             ttl_dns_cache=300,  # 5 minutes DNS cache
         )
         
@@ -127,8 +132,13 @@ class ConnectionPoolManager:
             
         Note:
             This method is thread-safe and ensures only one session
-            is created even when called concurrently.
+            is created even when called concurrently. Once the session
+            exists it is returned without taking the lock.
         """
+        session = self._session
+        if session is not None and not session.closed:
+            return session
+
         async with self._session_lock:
             if self._session is None or self._session.closed:
                 self._session = await self._create_session()
@@ -149,9 +159,14 @@ class ConnectionPoolManager:
         session = await self.get_session()
         try:
             yield session
-        except Exception:
-            # Log any errors but don't close session - it may be reused
-            self.logger.exception("Error in session context")
+        except Exception as e:
+            # Log any errors but don't close session - it may be reused.
+            # Callers re-raise these as their own errors, so the traceback
+            # is only formatted when debug logging is on.
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.exception("Error in session context")
+            else:
+                self.logger.error("Error in session context: %s: %s", type(e).__name__, e)
             raise
     
     async def close(self):
@@ -4,6 +4,10 @@ This module provides functionality to resolve Jira keys (like "TEST-123") to
 internal numeric issue IDs that are required by some Xray GraphQL operations.
 """
 
+import asyncio
+import functools
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 from enum import Enum
 
@@ -15,6 +19,10 @@ except ImportError:
     from exceptions import GraphQLError
 
 
+class _KeyNotFoundError(GraphQLError):
+    """Raised when every lookup method returned no match without an error."""
+
+
 class ResourceType(Enum):
     """Enumeration of Xray resource types for optimized ID resolution."""
     TEST = "test"
@@ -35,17 +43,42 @@ class IssueIdResolver:
 
     Attributes:
         client (XrayGraphQLClient): GraphQL client for API communication
-        cache (Dict[str, str]): In-memory cache for resolved IDs
+        cache (OrderedDict[str, str]): In-memory LRU cache for resolved IDs
+        max_cache_size (int): Maximum number of cached keys before the least
+            recently used entry is evicted
+        negative_ttl (float): Seconds a failed resolution is remembered
+        max_concurrent_lookups (int): Bound on concurrent bulk resolutions
     """
 
-    def __init__(self, client: XrayGraphQLClient):
+    def __init__(
+        self,
+        client: XrayGraphQLClient,
+        max_cache_size: int = 1024,
+        negative_ttl: float = 5.0,
+        max_concurrent_lookups: int = 8,
+    ):
         """Initialize the resolver with a GraphQL client.
 
         Args:
             client (XrayGraphQLClient): Authenticated GraphQL client instance
+            max_cache_size (int): Upper bound on cached Jira keys. Keeps memory
+                flat for long-running servers that see many distinct keys.
+            negative_ttl (float): How long (seconds) a key that failed to
+                resolve is rejected without querying again. A miss walks the
+                whole fallback chain, so repeated bad keys are expensive.
+            max_concurrent_lookups (int): Most keys resolved at once by
+                resolve_multiple_issue_ids. Each key can take several queries
+                against the rate-limited API and share the connection pool.
         """
         self.client = client
-        self.cache: Dict[str, str] = {}  # Simple in-memory cache
+        self.max_cache_size = max_cache_size
+        self.cache: "OrderedDict[str, str]" = OrderedDict()  # LRU: oldest first
+        # Keys currently being resolved; concurrent callers share one lookup
+        self._inflight: Dict[str, "asyncio.Task[str]"] = {}
+        self.negative_ttl = negative_ttl
+        # Keys that recently failed to resolve -> monotonic expiry time
+        self._negative_cache: Dict[str, float] = {}
+        self.max_concurrent_lookups = max_concurrent_lookups
 
     async def resolve_issue_id(self, identifier: str, resource_type: Optional[ResourceType] = None) -> str:
         """Resolve a Jira key or issue ID to a numeric issue ID using fallback chain.
@@ -64,21 +97,69 @@ class IssueIdResolver:
         if identifier.isdigit():
             return identifier
 
-        # Check cache first
-        if identifier in self.cache:
-            return self.cache[identifier]
+        # Check cache first (single lookup, refresh LRU position on hit)
+        cached = self.cache.get(identifier)
+        if cached is not None:
+            self.cache.move_to_end(identifier)
+            return cached
 
         # If it looks like a Jira key (contains dash), try to resolve it
         if "-" in identifier:
-            resolved_id = await self._resolve_with_fallback_chain(identifier, resource_type)
-            
-            # Cache the result for future use
-            self.cache[identifier] = resolved_id
-            return resolved_id
+            failed_until = self._negative_cache.get(identifier)
+            if failed_until is not None:
+                if time.monotonic() < failed_until:
+                    raise GraphQLError(
+                        f"Could not resolve Jira key {identifier} to issue ID through any available method"
+                    )
+                del self._negative_cache[identifier]
+
+            task = self._inflight.get(identifier)
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._resolve_and_cache(identifier, resource_type)
+                )
+                self._inflight[identifier] = task
+                task.add_done_callback(
+                    functools.partial(self._on_lookup_done, identifier)
+                )
+            # Shield so one cancelled caller doesn't cancel the shared lookup
+            return await asyncio.shield(task)
 
         # If it's neither numeric nor contains dash, assume it's already an issue ID
         return identifier
 
+    def _on_lookup_done(self, identifier: str, task: "asyncio.Task[str]") -> None:
+        """Forget a finished lookup so the next miss starts a new one."""
+        if self._inflight.get(identifier) is task:
+            del self._inflight[identifier]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every waiter was cancelled
+            task.exception()
+
+    async def _resolve_and_cache(
+        self, jira_key: str, resource_type: Optional[ResourceType] = None
+    ) -> str:
+        """Resolve a Jira key through the fallback chain and cache the result."""
+        try:
+            resolved_id = await self._resolve_with_fallback_chain(jira_key, resource_type)
+        except _KeyNotFoundError:
+            # Only clean misses are remembered; lookups that errored are not
+            if self.negative_ttl > 0:
+                self._negative_cache[jira_key] = time.monotonic() + self.negative_ttl
+                if len(self._negative_cache) > self.max_cache_size:
+                    # Oldest insertion first; drop it to keep the map bounded
+                    self._negative_cache.pop(next(iter(self._negative_cache)))
+            raise
+        self._cache_put(jira_key, resolved_id)
+        return resolved_id
+
+    def _cache_put(self, identifier: str, resolved_id: str) -> None:
+        """Store a resolved ID, evicting the least recently used entries."""
+        self.cache[identifier] = resolved_id
+        self.cache.move_to_end(identifier)
+        while len(self.cache) > self.max_cache_size:
+            self.cache.popitem(last=False)
+
     async def _resolve_with_fallback_chain(self, jira_key: str, resource_type: Optional[ResourceType] = None) -> str:
         """Resolve using fallback chain based on resource type optimization.
 
@@ -90,7 +171,10 @@ class IssueIdResolver:
             str: Numeric issue ID
 
         Raises:
-            GraphQLError: If resolution fails through all methods
+            GraphQLError: If resolution fails through all methods. A
+                _KeyNotFoundError means every method returned no match
+                without an error; a plain GraphQLError means at least one
+                method failed, so the key may still exist.
         """
         # Define fallback chain based on resource type hint
         if resource_type == ResourceType.TEST:
@@ -108,17 +192,23 @@ class IssueIdResolver:
             methods = [self._try_tests, self._try_test_sets, self._try_test_executions, self._try_test_plans, self._try_coverable_issues]
 
         # Try each method in the fallback chain
+        last_error = None
         for method in methods:
             try:
                 result = await method(jira_key)
                 if result:
                     return result
-            except GraphQLError:
+            except GraphQLError as e:
                 # Continue to next method if this one fails
+                last_error = e
                 continue
 
         # If all methods fail, raise error
-        raise GraphQLError(f"Could not resolve Jira key {jira_key} to issue ID through any available method")
+        message = f"Could not resolve Jira key {jira_key} to issue ID through any available method"
+        if last_error is not None:
+            # A failed lookup proves nothing about the key, so don't remember it
+            raise GraphQLError(message) from last_error
+        raise _KeyNotFoundError(message)
 
     async def _try_tests(self, jira_key: str) -> Optional[str]:
         """Try to resolve using getTests query."""
@@ -242,16 +332,26 @@ class IssueIdResolver:
 
         Raises:
             GraphQLError: If any identifier cannot be resolved
+
+        Note:
+            Identifiers are resolved concurrently, at most
+            max_concurrent_lookups at a time; results keep input order.
+            Duplicate keys share a single lookup via the in-flight map.
         """
-        resolved_ids = []
-        for identifier in identifiers:
-            resolved_id = await self.resolve_issue_id(identifier, resource_type)
-            resolved_ids.append(resolved_id)
-        return resolved_ids
+        semaphore = asyncio.Semaphore(self.max_concurrent_lookups)
+
+        async def resolve(identifier: str) -> str:
+            async with semaphore:
+                return await self.resolve_issue_id(identifier, resource_type)
+
+        return list(
+            await asyncio.gather(*(resolve(identifier) for identifier in identifiers))
+        )
 
     def clear_cache(self) -> None:
-        """Clear the ID resolution cache."""
+        """Clear the ID resolution cache, including remembered failures."""
         self.cache.clear()
+        self._negative_cache.clear()
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics for monitoring and debugging.
@@ -261,5 +361,7 @@ class IssueIdResolver:
         """
         return {
             "cache_size": len(self.cache),
+            "max_cache_size": self.max_cache_size,
+            "negative_cache_size": len(self._negative_cache),
             "cached_keys": list(self.cache.keys())
         }
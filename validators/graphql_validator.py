@@ -10,6 +10,7 @@ operations, fields, and arguments while blocking potentially dangerous construct
 
 import re
 import json
+from collections import OrderedDict
 from typing import Set, List, Optional, Dict, Any
 from dataclasses import dataclass
 
@@ -134,6 +135,9 @@ class GraphQLValidator:
     MAX_VARIABLES = 50
     MAX_ALIASES = 20
 
+    # Number of distinct query strings whose validation result is remembered
+    VALIDATED_QUERY_CACHE_SIZE = 256
+
     # Dangerous patterns to block
     DANGEROUS_PATTERNS = [
         r"__schema",       # Schema introspection
@@ -170,6 +174,11 @@ class GraphQLValidator:
             re.MULTILINE
         )
 
+        # LRU of query strings that passed validation -> stripped query.
+        # Tools send the same templated queries with different variables,
+        # and query checks don't depend on variables.
+        self._validated_queries: "OrderedDict[str, str]" = OrderedDict()
+
     def validate_query(
         self, query: str, variables: Optional[Dict[str, Any]] = None
     ) -> str:
@@ -182,6 +191,37 @@ class GraphQLValidator:
         Returns:
             Validated and sanitized query string
 
+        Raises:
+            ValidationError: If query contains dangerous patterns or is invalid
+
+        Note:
+            Query strings that already passed validation are served from an
+            LRU cache; variables are always validated.
+        """
+        validated = self._validated_queries.get(query)
+        if validated is not None:
+            self._validated_queries.move_to_end(query)
+        else:
+            validated = self._validate_query_text(query)
+            self._validated_queries[query] = validated
+            if len(self._validated_queries) > self.VALIDATED_QUERY_CACHE_SIZE:
+                self._validated_queries.popitem(last=False)
+
+        # Validate variables if provided
+        if variables:
+            self._validate_variables(variables)
+
+        return validated
+
+    def _validate_query_text(self, query: str) -> str:
+        """Run the variable-independent checks on a query string.
+
+        Args:
+            query: GraphQL query string to validate
+
+        Returns:
+            Stripped query string
+
         Raises:
             ValidationError: If query contains dangerous patterns or is invalid
         """
@@ -204,10 +244,6 @@ class GraphQLValidator:
         self._validate_operation(parsed)
         self._validate_fields(parsed, query)
         self._validate_depth(query)
-        
-        # Validate variables if provided
-        if variables:
-            self._validate_variables(variables)
 
         return query.strip()
 